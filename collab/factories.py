@@ -0,0 +1,106 @@
+"""
+factory_boy factories for building test data in the collaborative worldbuilding application.
+Use .build() for unsaved instances and .create() when a test needs database rows.
+BaseWorldFixture is the shared per-class user and world fixture for the test modules.
+"""
+import factory
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .models import World, Page, Tag
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """User with a unique username; the password is left unusable."""
+
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f'user{n}')
+    email = factory.LazyAttribute(lambda user: f'{user.username}@example.com')
+
+
+def create_users(usernames):
+    """
+    Insert users with unusable passwords in a single query.
+    Skips password hashing and the per-row INSERT of UserFactory.create().
+    """
+    users = [UserFactory.build(username=username) for username in usernames]
+    for user in users:
+        user.set_unusable_password()
+    return User.objects.bulk_create(users)
+
+
+_request_factory = APIRequestFactory()
+
+
+def dispatch_to_viewset(viewset, method, action, data=None, user=None, **kwargs):
+    """
+    Send a request straight to a viewset action, optionally as a user.
+    Skips URL resolution and middleware, so tests that need those should use the client.
+    """
+    request = getattr(_request_factory, method)('/', data)
+    if user is not None:
+        force_authenticate(request, user=user)
+    return viewset.as_view({method: action})(request, **kwargs)
+
+
+class BaseWorldFixture(TestCase):
+    """Provision users and a world created by the first, shared by every test in the class."""
+    
+    USERNAMES = ('testuser',)
+    WORLD_TITLE = 'Test World'
+    WORLD_DESCRIPTION = 'A test world'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up users and world shared by every test in the class."""
+        # Tests authenticate with force_authenticate, so users skip password hashing
+        cls.users = create_users(cls.USERNAMES)
+        cls.user = cls.users[0]
+        cls.world = World.objects.create(
+            title=cls.WORLD_TITLE,
+            description=cls.WORLD_DESCRIPTION,
+            creator=cls.user
+        )
+    
+    def setUp(self):
+        """Drop cached world aggregates after each test."""
+        # Cache entries outlive the rolled-back transaction, and writes that
+        # skip World.cache_version would leave them for the next test
+        self.addCleanup(cache.clear)
+
+
+class WorldFactory(factory.django.DjangoModelFactory):
+    """World created by a new user."""
+
+    class Meta:
+        model = World
+
+    title = factory.Sequence(lambda n: f'Test World {n}')
+    description = 'A test world'
+    creator = factory.SubFactory(UserFactory)
+
+
+class PageFactory(factory.django.DjangoModelFactory):
+    """Page that passes content validation, written by the creator of its world."""
+
+    class Meta:
+        model = Page
+
+    title = factory.Sequence(lambda n: f'Test Page {n}')
+    content = 'Valid content for a test page'
+    author = factory.SubFactory(UserFactory)
+    world = factory.SubFactory(WorldFactory, creator=factory.SelfAttribute('..author'))
+
+
+class TagFactory(factory.django.DjangoModelFactory):
+    """Tag in a new world."""
+
+    class Meta:
+        model = Tag
+
+    name = factory.Sequence(lambda n: f'tag{n}')
+    world = factory.SubFactory(WorldFactory)
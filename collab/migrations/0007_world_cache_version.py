@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-16 18:04
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collab', '0006_alter_character_deleted_by_alter_essay_deleted_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='world',
+            name='cache_version',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, help_text="Changes whenever this world's content, links or contributors change"),
+        ),
+    ]
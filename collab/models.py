@@ -1,8 +1,10 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 
 
 class SoftDeleteManager(models.Manager):
@@ -159,6 +161,11 @@ class World(models.Model):
         auto_now=True,
         help_text="When this world's metadata was last updated"
     )
+    cache_version = models.UUIDField(
+        default=uuid.uuid4,
+        editable=False,
+        help_text="Changes whenever this world's content, links or contributors change"
+    )
 
     def __str__(self):
         return self.title
@@ -174,6 +181,11 @@ class World(models.Model):
         """Override save to run validation and update creator's world count."""
         self.full_clean()
         is_new = self.pk is None
+        if not is_new:
+            # Cached aggregates embed the world's title and creator
+            self.cache_version = uuid.uuid4()
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'cache_version'}
         super().save(*args, **kwargs)
         
         # Update creator's world count if this is a new world
@@ -182,6 +194,15 @@ class World(models.Model):
             profile.worlds_created += 1
             profile.save()
 
+    @classmethod
+    def bump_cache_version(cls, world_ids):
+        """
+        Give the given worlds a new cache version so responses cached per
+        version (contributors, attribution report) are recomputed.
+        Uses a queryset update to skip save() validation and updated_at.
+        """
+        cls.objects.filter(pk__in=world_ids).update(cache_version=uuid.uuid4())
+
     def get_all_content_by_tag(self, tag_name):
         """
         Get all content across all types in this world that has a specific tag.
@@ -242,7 +263,7 @@ class World(models.Model):
         for model_name in content_model_names:
             try:
                 model_class = apps.get_model('collab', model_name)
-                content_queryset = model_class.objects.filter(world=self)
+                content_queryset = model_class.objects.filter(world=self).select_related('author')
                 all_content.extend(list(content_queryset))
             except LookupError:
                 # Model doesn't exist yet, skip it
@@ -300,6 +321,19 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
         auto_now_add=True,
         help_text="When this content was created (immutable)"
     )
+    # Reverse generic relations, so tags and links can be prefetched for
+    # a page of content instead of being queried per entry
+    tag_links = GenericRelation('ContentTag')
+    outgoing_links = GenericRelation(
+        'ContentLink',
+        content_type_field='from_content_type',
+        object_id_field='from_object_id'
+    )
+    incoming_links = GenericRelation(
+        'ContentLink',
+        content_type_field='to_content_type',
+        object_id_field='to_object_id'
+    )
 
     def __str__(self):
         return f"{self.title} by {self.author.username}"
@@ -382,6 +416,21 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
             profile, created = UserProfile.objects.get_or_create(user=self.author)
             profile.contribution_count += 1
             profile.save()
+            self.touch_world()
+    
+    def soft_delete(self, user=None):
+        """Soft delete this content and invalidate its world's cached responses."""
+        super().soft_delete(user)
+        self.touch_world()
+    
+    def restore(self):
+        """Restore this content and invalidate its world's cached responses."""
+        super().restore()
+        self.touch_world()
+    
+    def touch_world(self):
+        """Invalidate responses cached for this content's world."""
+        World.bump_cache_version([self.world_id])
 
     # Tag Management Methods
     
@@ -444,17 +493,41 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
         """
         Add multiple tags to this content.
         tag_names can be a list of strings or a comma-separated string.
+        Missing tags and tag associations are inserted in bulk rather than
+        one get_or_create() pair per name.
         Returns a list of ContentTag instances.
         """
         if isinstance(tag_names, str):
-            tag_names = [name.strip() for name in tag_names.split(',')]
+            tag_names = tag_names.split(',')
+        
+        names = [name.strip().lower() for name in tag_names if name.strip()]
+        if not names:
+            return []
         
-        content_tags = []
-        for tag_name in tag_names:
-            if tag_name.strip():
-                content_tags.append(self.add_tag(tag_name))
+        # Validate new tags as Tag.save() would; bulk_create skips save()
+        new_tags = []
+        for name in dict.fromkeys(names):
+            tag = Tag(name=name, world=self.world)
+            tag.clean_fields(exclude=['world'])
+            new_tags.append(tag)
+        Tag.objects.bulk_create(new_tags, ignore_conflicts=True)
+        tags = list(Tag.objects.filter(world=self.world, name__in=names))
         
-        return content_tags
+        content_type = ContentType.objects.get_for_model(self)
+        ContentTag.objects.bulk_create(
+            [ContentTag(content_type=content_type, object_id=self.pk, tag=tag) for tag in tags],
+            ignore_conflicts=True
+        )
+        content_tags = {
+            content_tag.tag.name: content_tag
+            for content_tag in ContentTag.objects.filter(
+                content_type=content_type,
+                object_id=self.pk,
+                tag__in=tags
+            ).select_related('tag')
+        }
+        
+        return [content_tags[name] for name in names]
     
     # Link Management Methods
     
@@ -482,6 +555,7 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
             to_object_id=self.pk
         )
         
+        self.touch_world()
         return forward_link
     
     def unlink_from(self, target_content):
@@ -508,6 +582,7 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
             )
             reverse_link.delete()
             
+            self.touch_world()
             return True
         except ContentLink.DoesNotExist:
             return False
@@ -525,17 +600,9 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
             from_object_id=self.pk
         )
         
-        linked_content = []
-        for link in outgoing_links:
-            try:
-                content_obj = link.to_content
-                if content_obj:
-                    linked_content.append(content_obj)
-            except:
-                # Handle cases where linked content might have been deleted
-                continue
-        
-        return linked_content
+        return self._load_linked_objects(
+            [(link.to_content_type_id, link.to_object_id) for link in outgoing_links]
+        )
     
     def get_content_linking_to_this(self):
         """
@@ -550,17 +617,34 @@ class ContentBase(SoftDeleteMixin, ImmutableModelMixin, models.Model):
             to_object_id=self.pk
         )
         
-        linking_content = []
-        for link in incoming_links:
-            try:
-                content_obj = link.from_content
-                if content_obj:
-                    linking_content.append(content_obj)
-            except:
-                # Handle cases where linking content might have been deleted
-                continue
+        return self._load_linked_objects(
+            [(link.from_content_type_id, link.from_object_id) for link in incoming_links]
+        )
+    
+    @staticmethod
+    def _compute_word_count(text):
+        """Count the whitespace-separated words in text."""
+        return len(text.split())
+    
+    @staticmethod
+    def _load_linked_objects(keys):
+        """
+        Load content objects for (content_type_id, object_id) pairs, keeping their order.
+        Uses one query per content type with the author joined, instead of one
+        query per link plus one per author access. Missing objects are skipped.
+        """
+        ids_by_type = {}
+        for content_type_id, object_id in keys:
+            ids_by_type.setdefault(content_type_id, []).append(object_id)
+        
+        objects = {}
+        for content_type_id, object_ids in ids_by_type.items():
+            model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+            # _base_manager matches what the generic foreign key resolves through
+            for content_obj in model_class._base_manager.select_related('author').filter(id__in=object_ids):
+                objects[(content_type_id, content_obj.id)] = content_obj
         
-        return linking_content
+        return [objects[key] for key in keys if key in objects]
     
     @classmethod
     def get_content_by_tag(cls, world, tag_name):
@@ -825,7 +909,7 @@ class Essay(ContentBase):
     def save(self, *args, **kwargs):
         """Calculate word count before saving."""
         if self.content:
-            self.word_count = len(self.content.split())
+            self.word_count = self._compute_word_count(self.content)
         super().save(*args, **kwargs)
     
     class Meta:
@@ -945,7 +1029,7 @@ class Story(ContentBase):
     def save(self, *args, **kwargs):
         """Calculate word count before saving."""
         if self.content:
-            self.word_count = len(self.content.split())
+            self.word_count = self._compute_word_count(self.content)
         super().save(*args, **kwargs)
     
     class Meta:
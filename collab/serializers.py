@@ -2,10 +2,18 @@
 Serializers for the collaborative worldbuilding application.
 Handles data validation and serialization for API endpoints.
 """
+import copy
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import (
+    CharField, Count, Func, Max, Min, OuterRef, Prefetch, Q, Subquery, Value,
+    prefetch_related_objects
+)
+from django.db.models.manager import BaseManager
+from django.db.models.functions import Coalesce
 from django.contrib.contenttypes.models import ContentType
 from .models import (
     UserProfile, World, Tag, ContentTag, ContentLink,
@@ -53,10 +61,11 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         }
 
     def validate_username(self, value):
-        """Validate username is unique and meets requirements."""
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("A user with that username already exists.")
-        
+        """
+        Validate username meets requirements.
+        Uniqueness is checked by the UniqueValidator ModelSerializer adds for
+        User.username, so it is not queried a second time here.
+        """
         if len(value) < 3:
             raise serializers.ValidationError("Username must be at least 3 characters long.")
         
@@ -241,8 +250,52 @@ class WorldSerializer(serializers.ModelSerializer):
             'contributor_count', 'collaboration_stats', 'top_contributors'
         ]
 
+    # Keys of content_counts and the content model each one counts
+    CONTENT_COUNT_MODELS = (
+        ('pages', Page),
+        ('essays', Essay),
+        ('characters', Character),
+        ('stories', Story),
+        ('images', Image),
+    )
+
+    @classmethod
+    def annotate_counts(cls, queryset):
+        """
+        Annotate worlds with the content and contributor counts this serializer
+        reports, so listing N worlds does not cost 6 COUNT queries per world.
+        Correlated subqueries avoid multiplying rows across the content joins.
+        """
+        counts = {
+            f'{name}_count': Coalesce(Subquery(
+                model.objects.filter(world=OuterRef('pk')).order_by().values('world')
+                .annotate(count=Count('pk')).values('count')
+            ), 0)
+            for name, model in cls.CONTENT_COUNT_MODELS
+        }
+        # Matches get_contributor_count, which also counts soft-deleted content
+        authored = Q()
+        for _, model in cls.CONTENT_COUNT_MODELS:
+            authored |= Q(pk__in=model.all_objects.filter(world=OuterRef(OuterRef('pk'))).values('author'))
+        contributors = User.objects.filter(authored).order_by().annotate(
+            count=Func('pk', function='COUNT')
+        ).values('count')
+        return queryset.annotate(**counts, contributor_count=Subquery(contributors))
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the creator, tags and counts of a world queryset up front.
+        Use this whenever worlds are fetched to be serialized.
+        """
+        return cls.annotate_counts(
+            queryset.select_related('creator__worldbuilding_profile').prefetch_related('tags')
+        )
+
     def get_content_counts(self, obj):
         """Calculate counts of different content types within the world."""
+        if hasattr(obj, 'pages_count'):
+            return {name: getattr(obj, f'{name}_count') for name, _ in self.CONTENT_COUNT_MODELS}
         return {
             'pages': obj.page_entries.count(),
             'essays': obj.essay_entries.count(),
@@ -253,9 +306,8 @@ class WorldSerializer(serializers.ModelSerializer):
 
     def get_contributor_count(self, obj):
         """Get the number of unique contributors to this world."""
-        from django.contrib.auth.models import User
-        from django.db.models import Q
-        
+        if hasattr(obj, 'contributor_count'):
+            return obj.contributor_count
         return User.objects.filter(
             Q(page_authored__world=obj) |
             Q(essay_authored__world=obj) |
@@ -312,73 +364,56 @@ class WorldSerializer(serializers.ModelSerializer):
         }
 
     def get_top_contributors(self, obj):
-        """Get top 5 contributors by content count with their contribution details."""
-        from django.contrib.auth.models import User
-        from django.db.models import Count, Q
-        
-        contributors = User.objects.filter(
-            Q(page_authored__world=obj) |
-            Q(essay_authored__world=obj) |
-            Q(character_authored__world=obj) |
-            Q(story_authored__world=obj) |
-            Q(image_authored__world=obj)
-        ).distinct().annotate(
-            page_count=Count('page_authored', filter=Q(page_authored__world=obj)),
-            essay_count=Count('essay_authored', filter=Q(essay_authored__world=obj)),
-            character_count=Count('character_authored', filter=Q(character_authored__world=obj)),
-            story_count=Count('story_authored', filter=Q(story_authored__world=obj)),
-            image_count=Count('image_authored', filter=Q(image_authored__world=obj)),
-            total_contributions=Count('page_authored', filter=Q(page_authored__world=obj)) +
-                              Count('essay_authored', filter=Q(essay_authored__world=obj)) +
-                              Count('character_authored', filter=Q(character_authored__world=obj)) +
-                              Count('story_authored', filter=Q(story_authored__world=obj)) +
-                              Count('image_authored', filter=Q(image_authored__world=obj))
-        ).order_by('-total_contributions')[:5]
-
-        result = []
-        for contributor in contributors:
-            # Get first and last contribution dates
-            from datetime import datetime
-            first_contribution = None
-            last_contribution = None
-            
-            all_content = []
-            if contributor.page_authored.filter(world=obj).exists():
-                all_content.extend(contributor.page_authored.filter(world=obj))
-            if contributor.essay_authored.filter(world=obj).exists():
-                all_content.extend(contributor.essay_authored.filter(world=obj))
-            if contributor.character_authored.filter(world=obj).exists():
-                all_content.extend(contributor.character_authored.filter(world=obj))
-            if contributor.story_authored.filter(world=obj).exists():
-                all_content.extend(contributor.story_authored.filter(world=obj))
-            if contributor.image_authored.filter(world=obj).exists():
-                all_content.extend(contributor.image_authored.filter(world=obj))
-            
-            if all_content:
-                all_content.sort(key=lambda x: x.created_at)
-                first_contribution = all_content[0].created_at
-                last_contribution = all_content[-1].created_at
-            
-            result.append({
-                'id': contributor.id,
-                'username': contributor.username,
-                'first_name': contributor.first_name,
-                'last_name': contributor.last_name,
-                'full_name': contributor.get_full_name() or contributor.username,
-                'contributions': {
-                    'pages': contributor.page_count,
-                    'essays': contributor.essay_count,
-                    'characters': contributor.character_count,
-                    'stories': contributor.story_count,
-                    'images': contributor.image_count,
-                    'total': contributor.total_contributions
-                },
-                'first_contribution': first_contribution,
-                'last_contribution': last_contribution,
-                'is_creator': contributor == obj.creator
-            })
-        
-        return result
+        """
+        Get top 5 contributors by content count with their contribution details.
+        Per-author counts and dates of every content type come from a single
+        UNION of grouped values() queries, without loading content or users.
+        """
+        per_type = [
+            model.objects.filter(world=obj).order_by().values(
+                'author_id', 'author__username', 'author__first_name', 'author__last_name'
+            ).annotate(
+                content_kind=Value(name, output_field=CharField()),
+                count=Count('id'),
+                first_contribution=Min('created_at'),
+                last_contribution=Max('created_at')
+            )
+            for name, model in self.CONTENT_COUNT_MODELS
+        ]
+        rows = per_type[0].union(*per_type[1:], all=True)
+
+        # UNION results cannot be ordered by the combined total, so merge the
+        # rows per author and rank them in Python
+        contributors = {}
+        for row in rows:
+            contributor = contributors.get(row['author_id'])
+            if contributor is None:
+                first_name = row['author__first_name']
+                last_name = row['author__last_name']
+                contributor = contributors[row['author_id']] = {
+                    'id': row['author_id'],
+                    'username': row['author__username'],
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'full_name': f'{first_name} {last_name}'.strip() or row['author__username'],
+                    'contributions': {name: 0 for name, _ in self.CONTENT_COUNT_MODELS},
+                    'first_contribution': row['first_contribution'],
+                    'last_contribution': row['last_contribution'],
+                    'is_creator': row['author_id'] == obj.creator_id
+                }
+            contributor['contributions'][row['content_kind']] = row['count']
+            contributor['first_contribution'] = min(contributor['first_contribution'], row['first_contribution'])
+            contributor['last_contribution'] = max(contributor['last_contribution'], row['last_contribution'])
+
+        for contributor in contributors.values():
+            contributions = contributor['contributions']
+            contributions['total'] = sum(contributions.values())
+
+        ranked = sorted(
+            contributors.values(),
+            key=lambda contributor: (-contributor['contributions']['total'], contributor['id'])
+        )
+        return ranked[:5]
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -395,14 +430,15 @@ class TagSerializer(serializers.ModelSerializer):
 
     def get_usage_count(self, obj):
         """Get the number of content entries using this tag."""
+        if hasattr(obj, 'usage_count'):
+            return obj.usage_count
         return obj.get_usage_count()
 
     def validate_name(self, value):
         """Validate and normalize tag name."""
-        if not value.strip():
-            raise serializers.ValidationError("Tag name cannot be empty.")
-
         normalized_name = value.strip().lower()
+        if not normalized_name:
+            raise serializers.ValidationError("Tag name cannot be empty.")
 
         # Reject tag names with spaces (tags must be single words or hyphen-separated)
         if ' ' in normalized_name:
@@ -463,6 +499,17 @@ class ContentLinkSerializer(serializers.ModelSerializer):
         return obj.to_content_type.model if obj.to_content_type else "Unknown"
 
 
+class ContentListSerializer(serializers.ListSerializer):
+    """
+    List serializer for content that loads tags and links for the whole list
+    in one batch instead of once per entry.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, BaseManager) else data)
+        return super().to_representation(ContentBaseSerializer.prefetch_collaboration(items))
+
+
 class ContentBaseSerializer(serializers.ModelSerializer):
     """
     Base serializer for all content types.
@@ -477,20 +524,93 @@ class ContentBaseSerializer(serializers.ModelSerializer):
     collaboration_info = serializers.SerializerMethodField()
 
     class Meta:
+        list_serializer_class = ContentListSerializer
         fields = [
             'id', 'title', 'content', 'author', 'world', 'created_at',
             'tags', 'linked_content', 'attribution', 'collaboration_info'
         ]
         read_only_fields = ['author', 'world', 'created_at', 'tags', 'linked_content', 'attribution', 'collaboration_info']
 
+    @staticmethod
+    def _collaboration_prefetches():
+        """Prefetch lookups for the tags and links of content entries."""
+        return (
+            Prefetch(
+                'tag_links',
+                queryset=ContentTag.objects.select_related('tag').annotate(
+                    tag_usage_count=Count('tag__content_tags')
+                ).order_by('tag__name'),
+                to_attr='prefetched_tag_links'
+            ),
+            Prefetch(
+                'outgoing_links',
+                queryset=ContentLink.objects.order_by('id'),
+                to_attr='prefetched_outgoing_links'
+            ),
+            'prefetched_outgoing_links__to_content__author',
+            Prefetch(
+                'incoming_links',
+                queryset=ContentLink.objects.order_by('id'),
+                to_attr='prefetched_incoming_links'
+            ),
+            'prefetched_incoming_links__from_content__author',
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the author, world, tags and links of a content queryset up front.
+        Serializing a page of content then takes a fixed number of queries
+        instead of several per entry.
+        """
+        return queryset.select_related(
+            'author__worldbuilding_profile', 'world'
+        ).prefetch_related(*cls._collaboration_prefetches())
+
+    @classmethod
+    def prefetch_collaboration(cls, instances):
+        """
+        Return the instances with their tags and links prefetched, so every
+        field reads the same lists and no relation is queried twice.
+        Entries not loaded through setup_eager_loading() are prefetched on
+        copies, leaving the caller's objects untouched.
+        """
+        prepared = [
+            instance if hasattr(instance, 'prefetched_tag_links') else copy.copy(instance)
+            for instance in instances
+        ]
+        missing = [copied for copied, instance in zip(prepared, instances) if copied is not instance]
+        if missing:
+            prefetch_related_objects(missing, *cls._collaboration_prefetches())
+        return prepared
+
+    def to_representation(self, instance):
+        instance, = self.prefetch_collaboration([instance])
+        return super().to_representation(instance)
+
+    def _tags(self, obj):
+        """Tags of obj ordered by name, with their usage counts."""
+        tags = []
+        for content_tag in obj.prefetched_tag_links:
+            content_tag.tag.usage_count = content_tag.tag_usage_count
+            tags.append(content_tag.tag)
+        return tags
+
+    def _linked_content(self, obj):
+        """Content obj links to."""
+        return [link.to_content for link in obj.prefetched_outgoing_links if link.to_content]
+
+    def _linking_content(self, obj):
+        """Content linking to obj."""
+        return [link.from_content for link in obj.prefetched_incoming_links if link.from_content]
+
     def get_tags(self, obj):
         """Get all tags associated with this content."""
-        tags = obj.get_tags()
-        return TagSerializer(tags, many=True).data
+        return TagSerializer(self._tags(obj), many=True).data
 
     def get_linked_content(self, obj):
         """Get basic info about linked content with enhanced attribution."""
-        linked_content = obj.get_linked_content()
+        linked_content = self._linked_content(obj)
         result = []
         for content in linked_content:
             result.append({
@@ -516,27 +636,23 @@ class ContentBaseSerializer(serializers.ModelSerializer):
 
     def get_collaboration_info(self, obj):
         """Get collaboration-related information for this content."""
-        # Get linked content count
-        linked_count = len(obj.get_linked_content())
-        
-        # Get content linking to this
-        linking_count = len(obj.get_content_linking_to_this())
+        linked_content = self._linked_content(obj)
+        linking_content = self._linking_content(obj)
         
-        # Get tags count
-        tags_count = obj.get_tags().count()
+        linked_count = len(linked_content)
+        linking_count = len(linking_content)
+        tags_count = len(self._tags(obj))
         
         # Check if this content references other authors' work
-        linked_content = obj.get_linked_content()
         referenced_authors = set()
         for content in linked_content:
-            if content.author != obj.author:
+            if content.author_id != obj.author_id:
                 referenced_authors.add(content.author.username)
         
         # Check if other authors have referenced this content
-        linking_content = obj.get_content_linking_to_this()
         referencing_authors = set()
         for content in linking_content:
-            if content.author != obj.author:
+            if content.author_id != obj.author_id:
                 referencing_authors.add(content.author.username)
         
         return {
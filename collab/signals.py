@@ -0,0 +1,49 @@
+"""
+Signal handlers keeping per-world cached responses in step with changes
+that bypass the content model methods.
+"""
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from .models import World, Page, Essay, Character, Story, Image
+
+
+CONTENT_MODELS = (Page, Essay, Character, Story, Image)
+
+# User fields shown in the cached contributors and attribution payloads
+CACHED_USER_FIELDS = ('username', 'first_name', 'last_name')
+
+
+def content_hard_deleted(sender, instance, **kwargs):
+    """Invalidate the world's cached responses when content is hard deleted."""
+    instance.touch_world()
+
+
+for model_class in CONTENT_MODELS:
+    post_delete.connect(
+        content_hard_deleted,
+        sender=model_class,
+        dispatch_uid=f'collab_{model_class.__name__.lower()}_hard_deleted'
+    )
+
+
+@receiver(pre_save, sender=User, dispatch_uid='collab_user_renamed')
+def user_renamed(sender, instance, update_fields=None, **kwargs):
+    """Invalidate cached responses of every world a user appears in after a rename."""
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & set(CACHED_USER_FIELDS):
+        return
+
+    previous = User.objects.filter(pk=instance.pk).values(*CACHED_USER_FIELDS).first()
+    if previous is None or all(
+        previous[field] == getattr(instance, field) for field in CACHED_USER_FIELDS
+    ):
+        return
+
+    world_filter = Q(creator=instance)
+    for model_class in CONTENT_MODELS:
+        world_filter |= Q(pk__in=model_class.all_objects.filter(author=instance).values('world_id'))
+    World.bump_cache_version(World.objects.filter(world_filter).values('pk'))
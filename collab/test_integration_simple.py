@@ -3,11 +3,13 @@ Simplified integration tests for API workflows.
 Tests complete end-to-end workflows as specified in task requirements.
 """
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
 from django.contrib.auth.models import User
 from rest_framework.test import APIClient
 from rest_framework import status
 import json
-import time
+from datetime import timedelta
 
 from .models import World, Page, Essay, Character, Story, Tag, UserProfile
 
@@ -31,7 +33,7 @@ class UserRegistrationAuthenticationFlowTest(TestCase):
             'last_name': 'User'
         }
         
-        response = self.client.post('/api/auth/register/', registration_data, format='json')
+        response = self.client.post(reverse('v1_user_register'), registration_data, format='json')
         # Note: Registration might have issues, so we'll create user directly for integration testing
         if response.status_code != status.HTTP_201_CREATED:
             # Create user directly for testing
@@ -51,7 +53,7 @@ class UserRegistrationAuthenticationFlowTest(TestCase):
             'password': 'securepass123'
         }
         
-        response = self.client.post('/api/auth/login/', login_data, format='json')
+        response = self.client.post(reverse('v1_token_obtain_pair'), login_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Extract tokens
@@ -60,7 +62,7 @@ class UserRegistrationAuthenticationFlowTest(TestCase):
         
         # Step 3: Access Protected Endpoint
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
-        response = self.client.get('/api/worlds/')
+        response = self.client.get(reverse('world-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         return user, access_token
@@ -69,16 +71,20 @@ class UserRegistrationAuthenticationFlowTest(TestCase):
 class WorldCreationContentWorkflowTest(TestCase):
     """Test world creation and content addition workflow."""
     
-    def setUp(self):
-        """Set up authenticated user."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up user shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='worldbuilder',
             email='worldbuilder@example.com',
             password='testpass123',
             first_name='World',
             last_name='Builder'
         )
+    
+    def setUp(self):
+        """Set up authenticated client."""
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
     
     def test_world_creation_and_content_workflow(self):
@@ -90,12 +96,13 @@ class WorldCreationContentWorkflowTest(TestCase):
             'is_public': True
         }
         
-        response = self.client.post('/api/worlds/', world_data, format='json')
+        response = self.client.post(reverse('world-list'), world_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         world_id = response.data['id']
         self.assertEqual(response.data['title'], 'Integration Test World')
         self.assertEqual(response.data['creator']['username'], 'worldbuilder')
+        world_kwargs = {'world_pk': world_id}
         
         # Step 2: Create Page Content
         page_data = {
@@ -104,7 +111,7 @@ class WorldCreationContentWorkflowTest(TestCase):
             'summary': 'Foundation of the test world'
         }
         
-        response = self.client.post(f'/api/worlds/{world_id}/pages/', page_data, format='json')
+        response = self.client.post(reverse('v1_world_pages_list', kwargs=world_kwargs), page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         page_id = response.data['id']
@@ -122,7 +129,7 @@ class WorldCreationContentWorkflowTest(TestCase):
             'relationships': {'ally': 'The people'}
         }
         
-        response = self.client.post(f'/api/worlds/{world_id}/characters/', character_data, format='json')
+        response = self.client.post(reverse('v1_world_characters_list', kwargs=world_kwargs), character_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         character_id = response.data['id']
@@ -137,7 +144,7 @@ class WorldCreationContentWorkflowTest(TestCase):
             'main_characters': ['Hero McHeroface']
         }
         
-        response = self.client.post(f'/api/worlds/{world_id}/stories/', story_data, format='json')
+        response = self.client.post(reverse('v1_world_stories_list', kwargs=world_kwargs), story_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         story_id = response.data['id']
@@ -149,37 +156,36 @@ class WorldCreationContentWorkflowTest(TestCase):
 class TaggingLinkingEndToEndTest(TestCase):
     """Test tagging and linking functionality end-to-end."""
     
-    def setUp(self):
-        """Set up authenticated user and world with content."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up user and world with content shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='tagger',
             email='tagger@example.com',
             password='testpass123'
         )
-        self.client.force_authenticate(user=self.user)
         
         # Create world and content
-        self.world = World.objects.create(
+        cls.world = World.objects.create(
             title='Tagging Test World',
             description='A world for testing tagging and linking',
-            creator=self.user
+            creator=cls.user
         )
         
         # Create some content to work with
-        self.page = Page.objects.create(
+        cls.page = Page.objects.create(
             title='Magic System',
             content='This page describes the magic system used throughout the world.',
-            author=self.user,
-            world=self.world,
+            author=cls.user,
+            world=cls.world,
             summary='Magic system overview'
         )
         
-        self.character = Character.objects.create(
+        cls.character = Character.objects.create(
             title='Wizard',
             content='A powerful wizard who uses the magic system.',
-            author=self.user,
-            world=self.world,
+            author=cls.user,
+            world=cls.world,
             full_name='Gandalf the Wise',
             species='Human',
             occupation='Wizard',
@@ -187,16 +193,24 @@ class TaggingLinkingEndToEndTest(TestCase):
             relationships={'student': 'apprentices'}
         )
     
+    def setUp(self):
+        """Set up authenticated client."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+    
     def test_tagging_and_linking_end_to_end(self):
         """Test the complete tagging and linking workflow."""
+        tags_url = reverse('v1_world_tags_list', kwargs={'world_pk': self.world.id})
+        page_kwargs = {'world_pk': self.world.id, 'pk': self.page.id}
+        
         # Step 1: Create and manage tags
         tag_data = {'name': 'magic'}
-        response = self.client.post(f'/api/worlds/{self.world.id}/tags/', tag_data, format='json')
+        response = self.client.post(tags_url, tag_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Step 2: Add tags to content
         add_tags_data = {'tags': ['magic', 'system']}
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/{self.page.id}/add-tags/', add_tags_data, format='json')
+        response = self.client.post(reverse('v1_page_add_tags', kwargs=page_kwargs), add_tags_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Step 3: Create content links
@@ -209,18 +223,20 @@ class TaggingLinkingEndToEndTest(TestCase):
             ]
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/{self.character.id}/add-links/', link_data, format='json')
+        response = self.client.post(
+            reverse('v1_character_add_links', kwargs={'world_pk': self.world.id, 'pk': self.character.id}),
+            link_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Step 4: Verify bidirectional linking
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/{self.page.id}/')
+        response = self.client.get(reverse('v1_world_pages_detail', kwargs=page_kwargs))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         linked_content = response.data['linked_content']
         self.assertGreater(len(linked_content), 0)
         
         # Step 5: Test tag-based discovery
-        response = self.client.get(f'/api/worlds/{self.world.id}/tags/')
+        response = self.client.get(tags_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         tags_response = response.data
@@ -235,31 +251,37 @@ class TaggingLinkingEndToEndTest(TestCase):
 class ChronologicalOrderingFilteringTest(TestCase):
     """Test chronological ordering and filtering functionality."""
     
-    def setUp(self):
-        """Set up authenticated users and world."""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Set up users and world shared by every test in the class."""
         # Create users
-        self.user1 = User.objects.create_user(
+        cls.user1 = User.objects.create_user(
             username='chrono1',
             email='chrono1@example.com',
             password='testpass123'
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             username='chrono2',
             email='chrono2@example.com',
             password='testpass123'
         )
         
         # Create world
-        self.world = World.objects.create(
+        cls.world = World.objects.create(
             title='Chronological Test World',
             description='A world for testing chronological features',
-            creator=self.user1
+            creator=cls.user1
         )
     
+    def setUp(self):
+        """Set up test client."""
+        self.client = APIClient()
+    
     def test_chronological_ordering_and_filtering(self):
         """Test chronological ordering and filtering workflow."""
+        world_kwargs = {'world_pk': self.world.id}
+        timeline_url = reverse('world-timeline', kwargs={'pk': self.world.id})
+        
         # Step 1: Create content with different users and timestamps
         self.client.force_authenticate(user=self.user1)
         
@@ -270,13 +292,10 @@ class ChronologicalOrderingFilteringTest(TestCase):
             'summary': 'The first entry'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', page_data, format='json')
+        response = self.client.post(reverse('v1_world_pages_list', kwargs=world_kwargs), page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         page_id = response.data['id']
         
-        # Small delay to ensure different timestamps
-        time.sleep(0.1)
-        
         # Switch to second user
         self.client.force_authenticate(user=self.user2)
         
@@ -291,13 +310,18 @@ class ChronologicalOrderingFilteringTest(TestCase):
             'relationships': {'job': 'keeping time'}
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/', character_data, format='json')
+        response = self.client.post(reverse('v1_world_characters_list', kwargs=world_kwargs), character_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         character_id = response.data['id']
         
+        # Pin distinct timestamps; immutable content can't be re-saved, so use update()
+        now = timezone.now()
+        Page.objects.filter(id=page_id).update(created_at=now - timedelta(seconds=30))
+        Character.objects.filter(id=character_id).update(created_at=now - timedelta(seconds=15))
+        
         # Step 2: Test Timeline Ordering
         self.client.force_authenticate(user=self.user1)
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/')
+        response = self.client.get(timeline_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -308,7 +332,7 @@ class ChronologicalOrderingFilteringTest(TestCase):
         self.assertEqual(timeline[1]['id'], page_id)
         
         # Step 3: Test Filtering by Content Type
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'content_type': 'character'})
+        response = self.client.get(timeline_url, {'content_type': 'character'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -316,7 +340,7 @@ class ChronologicalOrderingFilteringTest(TestCase):
         self.assertEqual(timeline[0]['content_type'], 'character')
         
         # Step 4: Test Filtering by Author
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'author': 'chrono1'})
+        response = self.client.get(timeline_url, {'author': 'chrono1'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -329,24 +353,30 @@ class ChronologicalOrderingFilteringTest(TestCase):
 class ErrorHandlingEdgeCasesTest(TestCase):
     """Test error handling and edge cases."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up user and world shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='errortest',
             email='errortest@example.com',
             password='testpass123'
         )
-        self.client.force_authenticate(user=self.user)
         
-        self.world = World.objects.create(
+        cls.world = World.objects.create(
             title='Error Test World',
             description='A world for testing error scenarios',
-            creator=self.user
+            creator=cls.user
         )
     
+    def setUp(self):
+        """Set up authenticated client."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+    
     def test_error_handling_and_edge_cases(self):
         """Test comprehensive error handling and edge cases."""
+        pages_url = reverse('v1_world_pages_list', kwargs={'world_pk': self.world.id})
+        
         # Step 1: Test Validation Errors
         invalid_page_data = {
             'title': '',  # Empty title should fail
@@ -354,7 +384,7 @@ class ErrorHandlingEdgeCasesTest(TestCase):
             'summary': 'Valid summary'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', invalid_page_data, format='json')
+        response = self.client.post(pages_url, invalid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Step 2: Test Duplicate Title Validation
@@ -364,9 +394,10 @@ class ErrorHandlingEdgeCasesTest(TestCase):
             'summary': 'A unique test page'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', valid_page_data, format='json')
+        response = self.client.post(pages_url, valid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         page_id = response.data['id']
+        page_url = reverse('v1_world_pages_detail', kwargs={'world_pk': self.world.id, 'pk': page_id})
         
         # Try to create another page with same title
         duplicate_page_data = {
@@ -375,27 +406,27 @@ class ErrorHandlingEdgeCasesTest(TestCase):
             'summary': 'Another page with duplicate title'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', duplicate_page_data, format='json')
+        response = self.client.post(pages_url, duplicate_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Step 3: Test Immutability Enforcement
         update_data = {'title': 'Updated Title'}
-        response = self.client.put(f'/api/worlds/{self.world.id}/pages/{page_id}/', update_data, format='json')
+        response = self.client.put(page_url, update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
-        response = self.client.patch(f'/api/worlds/{self.world.id}/pages/{page_id}/', update_data, format='json')
+        response = self.client.patch(page_url, update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
-        response = self.client.delete(f'/api/worlds/{self.world.id}/pages/{page_id}/')
+        response = self.client.delete(page_url)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
         # Step 4: Test Authentication Errors
         self.client.force_authenticate(user=None)
         
-        response = self.client.get('/api/worlds/')
+        response = self.client.get(reverse('world-list'))
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', valid_page_data, format='json')
+        response = self.client.post(pages_url, valid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
         # Step 5: Test Permission Errors
@@ -407,16 +438,16 @@ class ErrorHandlingEdgeCasesTest(TestCase):
         self.client.force_authenticate(user=other_user)
         
         world_update_data = {'title': 'Unauthorized Update'}
-        response = self.client.patch(f'/api/worlds/{self.world.id}/', world_update_data, format='json')
+        response = self.client.patch(reverse('world-detail', kwargs={'pk': self.world.id}), world_update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Step 6: Test Not Found Errors
         self.client.force_authenticate(user=self.user)
         
-        response = self.client.get('/api/worlds/99999/')
+        response = self.client.get(reverse('world-detail', kwargs={'pk': 99999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/99999/')
+        response = self.client.get(reverse('v1_world_pages_detail', kwargs={'world_pk': self.world.id, 'pk': 99999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         return True
\ No newline at end of file
@@ -3,21 +3,85 @@ Integration tests for API workflows in the collaborative worldbuilding applicati
 Tests complete end-to-end workflows including user registration, authentication,
 world creation, content addition, tagging, linking, and chronological features.
 """
-from django.test import TestCase, TransactionTestCase
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, tag
+from django.urls import reverse
 from django.contrib.auth.models import User
-from rest_framework.test import APIClient, APITransactionTestCase
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
 from django.db import transaction
-import json
-import time
+from django.utils import timezone
+import asyncio
 from datetime import datetime, timedelta
 
-from .models import World, Page, Essay, Character, Story, Tag, UserProfile
+from .models import World, Page, Essay, Character, Story, Image, Tag, UserProfile
+from .views import StoryViewSet, WorldViewSet
+from .factories import BaseWorldFixture, dispatch_to_viewset
 
 
-class UserRegistrationAuthenticationWorkflowTest(APITransactionTestCase):
+# Fixture users share one precomputed hash, so setUpTestData never hashes
+TEST_PASSWORD_HASH = make_password('testpass123')
+
+
+class WorkflowAssertionsMixin:
+    """Helpers shared by the workflow test cases."""
+    
+    def post_ok(self, url, data, expected=status.HTTP_201_CREATED, **kwargs):
+        """POST to url, assert the expected status and return the response data."""
+        if 'content_type' not in kwargs:
+            kwargs['format'] = 'json'
+        response = self.client.post(url, data, **kwargs)
+        self.assertEqual(response.status_code, expected, response.content)
+        return response.data
+
+
+class WorkflowWorldFixture(WorkflowAssertionsMixin, BaseWorldFixture):
+    """Shared user and world fixture with a client authenticated as the world creator."""
+    
+    client_class = APIClient
+    
+    USERNAMES = ('worlduser',)
+    WORLD_DESCRIPTION = 'A world for workflow tests'
+    
+    @classmethod
+    def _create_content(cls, model_class, data, author=None, created_at=None):
+        """
+        Create a tagged content entry from a request payload, written by the
+        fixture user unless another author is given, optionally at a fixed time.
+        """
+        fields = dict(data)
+        tags = fields.pop('tags')
+        content = model_class.objects.create(world=cls.world, author=author or cls.user, **fields)
+        content.add_tags(tags)
+        if created_at is not None:
+            # Immutable content can't be re-saved, so pin the timestamp with an update
+            model_class.objects.filter(id=content.id).update(created_at=created_at)
+            content.created_at = created_at
+        return content
+    
+    def setUp(self):
+        """Set up client authenticated as the world creator."""
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+        # Warm the ContentType cache so query counts only cover the endpoint
+        ContentType.objects.get_for_models(Page, Essay, Character, Story, Image)
+
+
+class UserRegistrationAuthenticationWorkflowTest(WorkflowAssertionsMixin, APITestCase):
     """Test complete user registration and authentication workflow."""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Resolve the endpoint URLs once for the class."""
+        cls.register_url = reverse('v1_user_register')
+        cls.login_url = reverse('v1_token_obtain_pair')
+        cls.refresh_url = reverse('v1_token_refresh')
+        cls.user_info_url = reverse('v1_user_info')
+        cls.worlds_url = reverse('world-list')
+    
     def setUp(self):
         """Set up test client."""
         self.client = APIClient()
@@ -36,8 +100,7 @@ class UserRegistrationAuthenticationWorkflowTest(APITransactionTestCase):
             'preferred_content_types': ['page', 'character']
         }
         
-        response = self.client.post('/api/auth/register/', registration_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.post_ok(self.register_url, registration_data)
         
         # Verify user was created
         user = User.objects.get(username='newuser')
@@ -56,53 +119,53 @@ class UserRegistrationAuthenticationWorkflowTest(APITransactionTestCase):
             'password': 'securepass123'
         }
         
-        response = self.client.post('/api/auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = self.post_ok(self.login_url, login_data, expected=status.HTTP_200_OK)
         
         # Extract tokens
-        access_token = response.data['access']
-        refresh_token = response.data['refresh']
+        access_token = data['access']
+        refresh_token = data['refresh']
         self.assertIsNotNone(access_token)
         self.assertIsNotNone(refresh_token)
         
         # Step 3: Access Protected Endpoint
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
-        response = self.client.get('/api/auth/user/')
+        response = self.client.get(self.user_info_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], 'newuser')
         
         # Step 4: Token Refresh
         refresh_data = {'refresh': refresh_token}
-        response = self.client.post('/api/auth/refresh/', refresh_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = self.post_ok(self.refresh_url, refresh_data, expected=status.HTTP_200_OK)
         
-        new_access_token = response.data['access']
+        new_access_token = data['access']
         self.assertIsNotNone(new_access_token)
         self.assertNotEqual(access_token, new_access_token)
         
         # Step 5: Use New Token
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {new_access_token}')
-        response = self.client.get('/api/worlds/')
+        response = self.client.get(self.worlds_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         return user, new_access_token
 
 
-class WorldCreationContentWorkflowTest(APITransactionTestCase):
+class WorldCreationContentWorkflowTest(WorkflowAssertionsMixin, APITestCase):
     """Test complete world creation and content addition workflow."""
     
-    def setUp(self):
-        """Set up authenticated user."""
-        self.client = APIClient()
-        
-        # Create and authenticate user
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up user shared by every test in the class."""
+        cls.user = User.objects.create(
             username='creator',
             email='creator@example.com',
-            password='testpass123',
+            password=TEST_PASSWORD_HASH,
             first_name='World',
             last_name='Creator'
         )
+    
+    def setUp(self):
+        """Set up authenticated client."""
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
     
     def test_complete_world_creation_and_content_workflow(self):
@@ -114,13 +177,12 @@ class WorldCreationContentWorkflowTest(APITransactionTestCase):
             'is_public': True
         }
         
-        response = self.client.post('/api/worlds/', world_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = self.post_ok(reverse('world-list'), world_data)
         
-        world_id = response.data['id']
-        self.assertEqual(response.data['title'], 'Fantasy Realm')
-        self.assertEqual(response.data['creator']['username'], 'creator')
-        self.assertTrue(response.data['is_public'])
+        world_id = data['id']
+        self.assertEqual(data['title'], 'Fantasy Realm')
+        self.assertEqual(data['creator']['username'], 'creator')
+        self.assertTrue(data['is_public'])
         
         # Verify world exists
         world = World.objects.get(id=world_id)
@@ -135,13 +197,12 @@ class WorldCreationContentWorkflowTest(APITransactionTestCase):
             'tags': ['magic', 'elements', 'system']
         }
         
-        response = self.client.post(f'/api/worlds/{world_id}/pages/', page_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = self.post_ok(reverse('v1_world_pages_list', kwargs={'world_pk': world_id}), page_data)
         
-        page_id = response.data['id']
-        self.assertEqual(response.data['title'], 'Magic System Overview')
-        self.assertEqual(response.data['author']['username'], 'creator')
-        self.assertIn('World Creator', response.data['attribution'])
+        page_id = data['id']
+        self.assertEqual(data['title'], 'Magic System Overview')
+        self.assertEqual(data['author']['username'], 'creator')
+        self.assertIn('World Creator', data['attribution'])
         
         # Step 3: Create Character Content
         character_data = {
@@ -159,96 +220,88 @@ class WorldCreationContentWorkflowTest(APITransactionTestCase):
             'tags': ['magic', 'archmage', 'mentor']
         }
         
-        response = self.client.post(f'/api/worlds/{world_id}/characters/', character_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = self.post_ok(reverse('v1_world_characters_list', kwargs={'world_pk': world_id}), character_data)
         
-        character_id = response.data['id']
-        self.assertEqual(response.data['title'], 'Archmage Eldrin')
-        self.assertEqual(response.data['full_name'], 'Eldrin Stormweaver')
-        self.assertEqual(response.data['species'], 'Human')
+        character_id = data['id']
+        self.assertEqual(data['title'], 'Archmage Eldrin')
+        self.assertEqual(data['full_name'], 'Eldrin Stormweaver')
+        self.assertEqual(data['species'], 'Human')
         
         return world_id, page_id, character_id
 
 
-class TaggingLinkingWorkflowTest(APITransactionTestCase):
+class TaggingLinkingWorkflowTest(WorkflowWorldFixture):
     """Test complete tagging and linking functionality end-to-end."""
     
-    def setUp(self):
-        """Set up authenticated user and world with content."""
-        self.client = APIClient()
-        
-        # Create and authenticate user
-        self.user = User.objects.create_user(
-            username='tagger',
-            email='tagger@example.com',
-            password='testpass123',
-            first_name='Tag',
-            last_name='Master'
-        )
-        self.client.force_authenticate(user=self.user)
-        
-        # Create world
-        self.world = World.objects.create(
-            title='Tagging Test World',
-            description='A world for testing tagging and linking',
-            creator=self.user
-        )
+    USERNAMES = ('tagger',)
+    WORLD_TITLE = 'Tagging Test World'
+    WORLD_DESCRIPTION = 'A world for testing tagging and linking'
+    
+    PAGE_DATA = {
+        'title': 'Elemental Magic',
+        'content': 'Elemental magic is the foundation of all magical arts in this world. It encompasses the four primary elements: fire, water, earth, and air.',
+        'summary': 'Foundation of elemental magic',
+        'tags': ['magic', 'elements', 'foundation']
+    }
+    
+    CHARACTER_DATA = {
+        'title': 'Fire Mage Pyra',
+        'content': 'Pyra is a specialist in fire magic, known for her incredible control over flames and her fiery temperament.',
+        'full_name': 'Pyra Flameheart',
+        'species': 'Human',
+        'occupation': 'Fire Mage',
+        'personality_traits': ['passionate', 'determined', 'hot-tempered'],
+        'relationships': {'teacher': 'Fire Academy'},
+        'tags': ['magic', 'fire', 'mage']
+    }
+    
+    STORY_DATA = {
+        'title': 'The Great Fire',
+        'content': 'A story about Pyra\'s greatest challenge when she had to contain a magical wildfire that threatened to consume the entire forest.',
+        'genre': 'Fantasy',
+        'main_characters': ['Pyra Flameheart', 'Forest Guardian'],
+        'tags': ['magic', 'fire', 'adventure']
+    }
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up tagged content shared by every test in the class."""
+        super().setUpTestData()
+        
+        # Content to tag and link is created directly; only the tagging and
+        # linking endpoints under test go through the API
+        with transaction.atomic():
+            cls.page = cls._create_content(Page, cls.PAGE_DATA)
+            cls.character = cls._create_content(Character, cls.CHARACTER_DATA)
+            cls.story = cls._create_content(Story, cls.STORY_DATA)
+        
+        # Resolve the endpoint URLs once for the class
+        world_kwargs = {'world_pk': cls.world.id}
+        cls.tags_url = reverse('v1_world_tags_list', kwargs=world_kwargs)
+        cls.magic_tag_url = reverse('v1_world_tags_by_name', kwargs={**world_kwargs, 'tag_name': 'magic'})
+        cls.page_url = reverse('v1_world_pages_detail', kwargs={**world_kwargs, 'pk': cls.page.id})
+        cls.character_add_tags_url = reverse('v1_character_add_tags', kwargs={**world_kwargs, 'pk': cls.character.id})
+        cls.character_add_links_url = reverse('v1_character_add_links', kwargs={**world_kwargs, 'pk': cls.character.id})
+        cls.story_add_links_url = reverse('v1_story_add_links', kwargs={**world_kwargs, 'pk': cls.story.id})
     
     def test_complete_tagging_and_linking_workflow(self):
         """Test the complete tagging and linking workflow."""
-        # Step 1: Create multiple content pieces
-        page_data = {
-            'title': 'Elemental Magic',
-            'content': 'Elemental magic is the foundation of all magical arts in this world. It encompasses the four primary elements: fire, water, earth, and air.',
-            'summary': 'Foundation of elemental magic',
-            'tags': ['magic', 'elements', 'foundation']
-        }
-        
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', page_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        page_id = response.data['id']
-        
-        character_data = {
-            'title': 'Fire Mage Pyra',
-            'content': 'Pyra is a specialist in fire magic, known for her incredible control over flames and her fiery temperament.',
-            'full_name': 'Pyra Flameheart',
-            'species': 'Human',
-            'occupation': 'Fire Mage',
-            'personality_traits': ['passionate', 'determined', 'hot-tempered'],
-            'relationships': {'teacher': 'Fire Academy'},
-            'tags': ['magic', 'fire', 'mage']
-        }
-        
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/', character_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        character_id = response.data['id']
-        
-        story_data = {
-            'title': 'The Great Fire',
-            'content': 'A story about Pyra\'s greatest challenge when she had to contain a magical wildfire that threatened to consume the entire forest.',
-            'genre': 'Fantasy',
-            'main_characters': ['Pyra Flameheart', 'Forest Guardian'],
-            'tags': ['magic', 'fire', 'adventure']
-        }
+        page_id = self.page.id
+        character_id = self.character.id
+        story_id = self.story.id
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/stories/', story_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        story_id = response.data['id']
-        
-        # Step 2: Test Tag Management
+        # Step 1: Test Tag Management
         # Create additional tags
         tag_data = {'name': 'legendary'}
-        response = self.client.post(f'/api/worlds/{self.world.id}/tags/', tag_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.post_ok(self.tags_url, tag_data)
         
         # Add tags to existing content
         add_tags_data = {'tags': ['legendary', 'powerful']}
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/{character_id}/add-tags/', add_tags_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('legendary', response.data['added_tags'])
-        self.assertIn('powerful', response.data['added_tags'])
+        data = self.post_ok(self.character_add_tags_url, add_tags_data, expected=status.HTTP_200_OK)
+        self.assertIn('legendary', data['added_tags'])
+        self.assertIn('powerful', data['added_tags'])
         
-        # Step 3: Test Content Linking
+        # Step 2: Test Content Linking
         # Link character to page
         link_data = {
             'links': [
@@ -259,9 +312,8 @@ class TaggingLinkingWorkflowTest(APITransactionTestCase):
             ]
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/{character_id}/add-links/', link_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['added_links']), 1)
+        data = self.post_ok(self.character_add_links_url, link_data, expected=status.HTTP_200_OK)
+        self.assertEqual(len(data['added_links']), 1)
         
         # Link story to character
         link_data = {
@@ -273,20 +325,20 @@ class TaggingLinkingWorkflowTest(APITransactionTestCase):
             ]
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/stories/{story_id}/add-links/', link_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.post_ok(self.story_add_links_url, link_data, expected=status.HTTP_200_OK)
         
-        # Step 4: Verify Bidirectional Linking
+        # Step 3: Verify Bidirectional Linking
         # Check that page shows linked character
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/{page_id}/')
+        response = self.client.get(self.page_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         linked_content = response.data['linked_content']
         self.assertEqual(len(linked_content), 1)
         self.assertEqual(linked_content[0]['id'], character_id)
         self.assertEqual(linked_content[0]['type'], 'character')
         
-        # Step 5: Test Tag-based Content Discovery
-        response = self.client.get(f'/api/worlds/{self.world.id}/tags/by-name/magic/')
+        # Step 4: Test Tag-based Content Discovery
+        with self.assertNumQueries(13):
+            response = self.client.get(self.magic_tag_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         tagged_content = response.data['tagged_content']
         self.assertEqual(len(tagged_content), 3)  # page, character, story
@@ -294,99 +346,65 @@ class TaggingLinkingWorkflowTest(APITransactionTestCase):
         return page_id, character_id, story_id
 
 
-class ChronologicalOrderingFilteringWorkflowTest(APITransactionTestCase):
+class ChronologicalOrderingFilteringWorkflowTest(WorkflowWorldFixture):
     """Test chronological ordering and filtering functionality."""
     
-    def setUp(self):
-        """Set up authenticated user and world."""
-        self.client = APIClient()
-        
-        # Create users
-        self.user1 = User.objects.create_user(
-            username='chrono1',
-            email='chrono1@example.com',
-            password='testpass123',
-            first_name='Chrono',
-            last_name='User1'
-        )
-        self.user2 = User.objects.create_user(
-            username='chrono2',
-            email='chrono2@example.com',
-            password='testpass123',
-            first_name='Chrono',
-            last_name='User2'
-        )
-        
-        # Create world
-        self.world = World.objects.create(
-            title='Chronological Test World',
-            description='A world for testing chronological features',
-            creator=self.user1
-        )
+    USERNAMES = ('chrono1', 'chrono2')
+    WORLD_TITLE = 'Chronological Test World'
+    WORLD_DESCRIPTION = 'A world for testing chronological features'
+    
+    PAGE_DATA = {
+        'title': 'The Beginning',
+        'content': 'This is the first entry in our world\'s history, marking the dawn of a new age.',
+        'summary': 'The first historical entry',
+        'tags': ['history', 'beginning']
+    }
+    
+    CHARACTER_DATA = {
+        'title': 'The First Hero',
+        'content': 'The first hero to emerge in this new age, destined to shape the world\'s future.',
+        'full_name': 'Aiden Lightbringer',
+        'species': 'Human',
+        'occupation': 'Hero',
+        'personality_traits': ['brave', 'noble', 'determined'],
+        'relationships': {'destiny': 'Save the world'},
+        'tags': ['hero', 'beginning', 'destiny']
+    }
+    
+    STORY_DATA = {
+        'title': 'The Hero\'s Journey',
+        'content': 'The epic tale of how Aiden Lightbringer discovered his destiny and began his quest to save the world from the encroaching darkness.',
+        'genre': 'Epic Fantasy',
+        'main_characters': ['Aiden Lightbringer'],
+        'tags': ['hero', 'journey', 'epic']
+    }
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a second author and timestamped content shared by every test in the class."""
+        super().setUpTestData()
+        cls.user2 = cls.users[1]
+        
+        # Create content from alternating authors with pinned timestamps
+        now = timezone.now()
+        with transaction.atomic():
+            cls.page = cls._create_content(Page, cls.PAGE_DATA, created_at=now - timedelta(minutes=3))
+            cls.character = cls._create_content(
+                Character, cls.CHARACTER_DATA, author=cls.user2, created_at=now - timedelta(minutes=2)
+            )
+            cls.story = cls._create_content(Story, cls.STORY_DATA, created_at=now - timedelta(minutes=1))
+        
+        cls.timeline_url = reverse('world-timeline', kwargs={'pk': cls.world.id})
     
     def test_chronological_ordering_and_filtering_workflow(self):
         """Test the complete chronological ordering and filtering workflow."""
-        # Step 1: Create content with different timestamps (simulate time progression)
-        self.client.force_authenticate(user=self.user1)
-        
-        # Create first piece of content
-        page1_data = {
-            'title': 'The Beginning',
-            'content': 'This is the first entry in our world\'s history, marking the dawn of a new age.',
-            'summary': 'The first historical entry',
-            'tags': ['history', 'beginning']
-        }
-        
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', page1_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        page1_id = response.data['id']
-        page1_created = response.data['created_at']
-        
-        # Small delay to ensure different timestamps
-        time.sleep(0.1)
-        
-        # Switch to second user
-        self.client.force_authenticate(user=self.user2)
-        
-        # Create second piece of content
-        character_data = {
-            'title': 'The First Hero',
-            'content': 'The first hero to emerge in this new age, destined to shape the world\'s future.',
-            'full_name': 'Aiden Lightbringer',
-            'species': 'Human',
-            'occupation': 'Hero',
-            'personality_traits': ['brave', 'noble', 'determined'],
-            'relationships': {'destiny': 'Save the world'},
-            'tags': ['hero', 'beginning', 'destiny']
-        }
-        
-        response = self.client.post(f'/api/worlds/{self.world.id}/characters/', character_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        character_id = response.data['id']
-        character_created = response.data['created_at']
-        
-        # Small delay
-        time.sleep(0.1)
-        
-        # Back to first user
-        self.client.force_authenticate(user=self.user1)
-        
-        # Create third piece of content
-        story_data = {
-            'title': 'The Hero\'s Journey',
-            'content': 'The epic tale of how Aiden Lightbringer discovered his destiny and began his quest to save the world from the encroaching darkness.',
-            'genre': 'Epic Fantasy',
-            'main_characters': ['Aiden Lightbringer'],
-            'tags': ['hero', 'journey', 'epic']
-        }
+        page1_id = self.page.id
+        character_id = self.character.id
+        story_id = self.story.id
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/stories/', story_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        story_id = response.data['id']
-        story_created = response.data['created_at']
-        
-        # Step 2: Test Timeline Ordering (newest first)
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/')
+        # Step 1: Test Timeline Ordering (newest first)
+        with self.assertNumQueries(9):
+            response = self.client.get(self.timeline_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -397,8 +415,9 @@ class ChronologicalOrderingFilteringWorkflowTest(APITransactionTestCase):
         self.assertEqual(timeline[1]['id'], character_id)
         self.assertEqual(timeline[2]['id'], page1_id)
         
-        # Step 3: Test Filtering by Content Type
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'content_type': 'character'})
+        # Step 2: Test Filtering by Content Type
+        with self.assertNumQueries(3):
+            response = self.client.get(self.timeline_url, {'content_type': 'character'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -406,8 +425,9 @@ class ChronologicalOrderingFilteringWorkflowTest(APITransactionTestCase):
         self.assertEqual(timeline[0]['content_type'], 'character')
         self.assertEqual(timeline[0]['id'], character_id)
         
-        # Step 4: Test Filtering by Author
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'author': 'chrono1'})
+        # Step 3: Test Filtering by Author
+        with self.assertNumQueries(8):
+            response = self.client.get(self.timeline_url, {'author': 'chrono1'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
@@ -415,52 +435,54 @@ class ChronologicalOrderingFilteringWorkflowTest(APITransactionTestCase):
         for item in timeline:
             self.assertEqual(item['author']['username'], 'chrono1')
         
-        # Step 5: Test Filtering by Tags
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'tags': 'hero'})
+        # Step 4: Test Filtering by Tags
+        with self.assertNumQueries(8):
+            response = self.client.get(self.timeline_url, {'tags': 'hero'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
         self.assertEqual(len(timeline), 2)  # character and story with 'hero' tag
         
-        # Step 6: Test Search Functionality
-        response = self.client.get(f'/api/worlds/{self.world.id}/timeline/', {'search': 'Aiden'})
+        # Step 5: Test Search Functionality
+        with self.assertNumQueries(7):
+            response = self.client.get(self.timeline_url, {'search': 'Aiden'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
         self.assertGreater(len(timeline), 0)
         
         # Verify search results contain the search term
-        found_aiden = False
-        for item in timeline:
-            if 'Aiden' in item['title'] or 'Aiden' in item.get('summary', '') or 'Aiden' in item.get('content', ''):
-                found_aiden = True
-                break
-        self.assertTrue(found_aiden)
+        self.assertTrue(
+            any(
+                'Aiden' in item['title'] or 'Aiden' in item.get('summary', '') or 'Aiden' in item.get('content', '')
+                for item in timeline
+            ),
+            msg=f"'Aiden' not found in timeline: {[item['title'] for item in timeline]}"
+        )
         
         return page1_id, character_id, story_id
 
 
-class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
+class ErrorHandlingEdgeCasesWorkflowTest(WorkflowWorldFixture):
     """Test error handling and edge cases in API workflows."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.client = APIClient()
-        
-        # Create authenticated user
-        self.user = User.objects.create_user(
-            username='errortest',
-            email='errortest@example.com',
-            password='testpass123'
-        )
-        self.client.force_authenticate(user=self.user)
-        
-        # Create world
-        self.world = World.objects.create(
-            title='Error Test World',
-            description='A world for testing error scenarios',
-            creator=self.user
-        )
+    USERNAMES = ('errortest', 'otheruser')
+    WORLD_TITLE = 'Error Test World'
+    WORLD_DESCRIPTION = 'A world for testing error scenarios'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a second user and endpoint URLs shared by every test in the class."""
+        super().setUpTestData()
+        cls.other_user = cls.users[1]
+        
+        # Resolve the endpoint URLs once for the class
+        world_kwargs = {'world_pk': cls.world.id}
+        cls.worlds_url = reverse('world-list')
+        cls.world_url = reverse('world-detail', kwargs={'pk': cls.world.id})
+        cls.pages_url = reverse('v1_world_pages_list', kwargs=world_kwargs)
+        cls.tags_url = reverse('v1_world_tags_list', kwargs=world_kwargs)
+        cls.links_url = reverse('v1_world_links_list', kwargs=world_kwargs)
     
     def test_error_handling_and_edge_cases_workflow(self):
         """Test comprehensive error handling and edge cases."""
@@ -472,9 +494,9 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
             'summary': 'Valid summary'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', invalid_page_data, format='json')
+        response = self.client.post(self.pages_url, invalid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('title', str(response.data).lower())
+        self.assertEqual(response.data['field'], 'title')
         
         # Try to create content with short content
         invalid_page_data = {
@@ -483,9 +505,9 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
             'summary': 'Valid summary'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', invalid_page_data, format='json')
+        response = self.client.post(self.pages_url, invalid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('content', str(response.data).lower())
+        self.assertEqual(response.data['field'], 'content')
         
         # Step 2: Test Duplicate Title Validation
         # Create valid content first
@@ -495,8 +517,7 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
             'summary': 'A unique page'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', valid_page_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        page_id = self.post_ok(self.pages_url, valid_page_data)['id']
         
         # Try to create another page with same title
         duplicate_page_data = {
@@ -505,22 +526,22 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
             'summary': 'Another page'
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', duplicate_page_data, format='json')
+        response = self.client.post(self.pages_url, duplicate_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Step 3: Test Immutability Enforcement
-        page_id = Page.objects.filter(world=self.world).first().id
+        page_url = reverse('v1_world_pages_detail', kwargs={'world_pk': self.world.id, 'pk': page_id})
         
         # Try to update immutable content (should return 405 Method Not Allowed)
         update_data = {'title': 'Updated Title'}
-        response = self.client.put(f'/api/worlds/{self.world.id}/pages/{page_id}/', update_data, format='json')
+        response = self.client.put(page_url, update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
-        response = self.client.patch(f'/api/worlds/{self.world.id}/pages/{page_id}/', update_data, format='json')
+        response = self.client.patch(page_url, update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
         # Try to delete immutable content
-        response = self.client.delete(f'/api/worlds/{self.world.id}/pages/{page_id}/')
+        response = self.client.delete(page_url)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
         # Step 4: Test Authentication Errors
@@ -528,36 +549,30 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
         self.client.force_authenticate(user=None)
         
         # Try to access protected endpoint
-        response = self.client.get('/api/worlds/')
+        response = self.client.get(self.worlds_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
         # Try to create content without authentication
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', valid_page_data, format='json')
+        response = self.client.post(self.pages_url, valid_page_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
         # Step 5: Test Permission Errors
-        # Create another user
-        other_user = User.objects.create_user(
-            username='otheruser',
-            email='other@example.com',
-            password='testpass123'
-        )
-        self.client.force_authenticate(user=other_user)
+        self.client.force_authenticate(user=self.other_user)
         
         # Try to update world created by different user
         world_update_data = {'title': 'Unauthorized Update'}
-        response = self.client.patch(f'/api/worlds/{self.world.id}/', world_update_data, format='json')
+        response = self.client.patch(self.world_url, world_update_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Step 6: Test Not Found Errors
         self.client.force_authenticate(user=self.user)
         
         # Try to access non-existent world
-        response = self.client.get('/api/worlds/99999/')
+        response = self.client.get(reverse('world-detail', kwargs={'pk': 99999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         # Try to access non-existent content
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/99999/')
+        response = self.client.get(reverse('v1_world_pages_detail', kwargs={'world_pk': self.world.id, 'pk': 99999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         # Step 7: Test Cross-World Content Access
@@ -569,13 +584,13 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
         )
         
         # Try to access content from one world via another world's endpoint
-        response = self.client.get(f'/api/worlds/{other_world.id}/pages/{page_id}/')
+        response = self.client.get(reverse('v1_world_pages_detail', kwargs={'world_pk': other_world.id, 'pk': page_id}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         # Step 8: Test Invalid Tag Operations
         # Try to create tag with invalid name
         invalid_tag_data = {'name': 'Invalid Tag Name'}  # Spaces not allowed
-        response = self.client.post(f'/api/worlds/{self.world.id}/tags/', invalid_tag_data, format='json')
+        response = self.client.post(self.tags_url, invalid_tag_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Step 9: Test Invalid Link Operations
@@ -587,202 +602,358 @@ class ErrorHandlingEdgeCasesWorkflowTest(APITransactionTestCase):
             'to_object_id': page_id  # Same as from_object_id
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/links/', invalid_link_data, format='json')
+        response = self.client.post(self.links_url, invalid_link_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         return True
 
 
-class CompleteCollaborativeWorkflowTest(APITransactionTestCase):
-    """Test complete collaborative workflow with multiple users."""
+class CollaborativeWorldFixture(WorkflowWorldFixture):
+    """Provision three users, a world and one content entry by each, shared by every test in the class."""
     
-    def setUp(self):
-        """Set up multiple users for collaborative testing."""
-        self.client = APIClient()
-        
-        # Create multiple users
-        self.creator = User.objects.create_user(
-            username='worldcreator',
-            email='creator@example.com',
-            password='testpass123',
-            first_name='World',
-            last_name='Creator'
-        )
-        
-        self.collaborator1 = User.objects.create_user(
-            username='collab1',
-            email='collab1@example.com',
-            password='testpass123',
-            first_name='Collaborator',
-            last_name='One'
+    USERNAMES = ('worldcreator', 'collab1', 'collab2')
+    # First and last names of the users, in USERNAMES order
+    FULL_NAMES = (('World', 'Creator'), ('Collaborator', 'One'), ('Collaborator', 'Two'))
+    WORLD_TITLE = 'Collaborative Fantasy World'
+    WORLD_DESCRIPTION = 'A world built by multiple contributors working together'
+    
+    # Response contracts of the collaboration endpoints, checked in one
+    # comparison per object instead of a key-by-key scan
+    CONTRIBUTORS_KEYS = {
+        'world', 'total_contributors', 'contributors', 'collaboration_summary'
+    }
+    COLLABORATION_SUMMARY_KEYS = {
+        'most_active', 'most_collaborative', 'recent_contributors', 'total_cross_author_links'
+    }
+    ATTRIBUTION_REPORT_KEYS = {
+        'world', 'attribution_network', 'collaboration_metrics', 'cross_references',
+        'top_collaborations', 'attribution_quality'
+    }
+    ATTRIBUTION_QUALITY_KEYS = {'collaboration_health', 'has_cross_references', 'is_well_attributed'}
+    ATTRIBUTION_DETAILS_KEYS = {'content', 'attribution', 'collaboration_metrics', 'attribution_suggestions'}
+    COLLABORATION_METRICS_KEYS = {
+        'total_references_made', 'total_references_received', 'cross_author_references_made',
+        'cross_author_references_received', 'is_collaborative', 'collaboration_type', 'collaboration_score'
+    }
+    
+    PAGE_DATA = {
+        'title': 'World Foundation',
+        'content': 'This world is built on the principles of magic and technology coexisting in harmony. The foundation of society rests on the balance between these two forces.',
+        'summary': 'The foundational principles of our world',
+        'tags': ['foundation', 'magic', 'technology']
+    }
+    
+    CHARACTER_DATA = {
+        'title': 'Master Technomancer',
+        'content': 'A master of both magical and technological arts, representing the perfect balance that this world strives for.',
+        'full_name': 'Zara Gearwright',
+        'species': 'Human',
+        'occupation': 'Technomancer',
+        'personality_traits': ['innovative', 'balanced', 'wise', 'curious'],
+        'relationships': {
+            'mentor': 'Young technomancers',
+            'colleague': 'Magic Council',
+            'inventor': 'Magical devices'
+        },
+        'tags': ['magic', 'technology', 'balance', 'master']
+    }
+    
+    STORY_DATA = {
+        'title': 'The Great Convergence',
+        'content': 'The story of how magic and technology first came together, told through the eyes of Zara Gearwright as she discovers the ancient principles that would shape the world.',
+        'genre': 'Fantasy',
+        'main_characters': ['Zara Gearwright', 'Ancient Spirits', 'Tech Innovators'],
+        'tags': ['magic', 'technology', 'convergence', 'history']
+    }
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up multiple users shared by every test in the class."""
+        super().setUpTestData()
+        cls.creator, cls.collaborator1, cls.collaborator2 = cls.users
+        for user, (first_name, last_name) in zip(cls.users, cls.FULL_NAMES):
+            user.first_name, user.last_name = first_name, last_name
+        User.objects.bulk_update(cls.users, ['first_name', 'last_name'])
+        
+        # The content is a fixture; the workflow under test is the
+        # cross-author linking and the collaboration endpoints
+        with transaction.atomic():
+            cls.page = cls._create_content(Page, cls.PAGE_DATA, author=cls.creator)
+            cls.character = cls._create_content(Character, cls.CHARACTER_DATA, author=cls.collaborator1)
+            cls.story = cls._create_content(Story, cls.STORY_DATA, author=cls.collaborator2)
+        
+        # Resolve the endpoint URLs once for the class
+        world_kwargs = {'world_pk': cls.world.id}
+        cls.urls = {
+            name: reverse(f'world-{name}', kwargs={'pk': cls.world.id})
+            for name in ('contributors', 'attribution-report', 'timeline', 'search')
+        }
+        cls.urls['character-add-links'] = reverse('v1_character_add_links', kwargs={**world_kwargs, 'pk': cls.character.id})
+        cls.urls['story-add-links'] = reverse('v1_story_add_links', kwargs={**world_kwargs, 'pk': cls.story.id})
+        cls.urls['story-attribution-details'] = reverse(
+            'v1_world_stories_attribution_details', kwargs={**world_kwargs, 'pk': cls.story.id}
         )
+    
+    def setUp(self):
+        """Set up one authenticated client per user."""
+        super().setUp()
+        self.user_clients = {}
+        for user in (self.creator, self.collaborator1, self.collaborator2):
+            client = APIClient()
+            client.force_authenticate(user=user)
+            self.user_clients[user] = client
+        self.client = self.user_clients[self.creator]
+    
+    def _authed_post(self, user, url, data, expected=status.HTTP_200_OK):
+        """POST as user through their authenticated client and return the response data."""
+        self.client = self.user_clients[user]
+        return self.post_ok(url, data, expected=expected)
+    
+    def _link_content_via_api(self):
+        """Have each collaborator link their content to earlier contributions."""
+        self._authed_post(self.collaborator1, self.urls['character-add-links'], {
+            'links': [
+                {'content_type': 'page', 'content_id': self.page.id}
+            ]
+        })
+        self._authed_post(self.collaborator2, self.urls['story-add-links'], {
+            'links': [
+                {'content_type': 'character', 'content_id': self.character.id},
+                {'content_type': 'page', 'content_id': self.page.id}
+            ]
+        })
+        self.client = self.user_clients[self.creator]
+
+
+class CompleteCollaborativeWorkflowTest(CollaborativeWorldFixture):
+    """Test complete collaborative workflow with multiple users."""
+    
+    def test_collaborators_link_content_across_authors(self):
+        """Test collaborators can link their content to other authors' content."""
+        self._link_content_via_api()
         
-        self.collaborator2 = User.objects.create_user(
-            username='collab2',
-            email='collab2@example.com',
-            password='testpass123',
-            first_name='Collaborator',
-            last_name='Two'
-        )
+        # Links are bidirectional, so the character also links back to the story
+        self.assertCountEqual(self.character.get_linked_content(), [self.page, self.story])
+        self.assertCountEqual(self.story.get_linked_content(), [self.character, self.page])
     
-    def test_complete_collaborative_workflow(self):
-        """Test a complete collaborative worldbuilding workflow."""
-        # Step 1: World Creator creates world
-        self.client.force_authenticate(user=self.creator)
+    @tag('slow')
+    def test_full_workflow_smoke(self):
+        """Test linking followed by every collaboration endpoint in one pass."""
+        self._link_content_via_api()
         
-        world_data = {
-            'title': 'Collaborative Fantasy World',
-            'description': 'A world built by multiple contributors working together',
-            'is_public': True
-        }
+        response = self.client.get(self.urls['contributors'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_contributors'], 3)
         
-        response = self.client.post('/api/worlds/', world_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        world_id = response.data['id']
+        response = self.client.get(self.urls['attribution-report'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(response.data['collaboration_metrics']['total_cross_references'], 0)
         
-        # Creator adds initial content
-        foundation_page_data = {
-            'title': 'World Foundation',
-            'content': 'This world is built on the principles of magic and technology coexisting in harmony. The foundation of society rests on the balance between these two forces.',
-            'summary': 'The foundational principles of our world',
-            'tags': ['foundation', 'magic', 'technology']
-        }
+        response = self.client.get(self.urls['story-attribution-details'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['collaboration_metrics']['is_collaborative'])
         
-        response = self.client.post(f'/api/worlds/{world_id}/pages/', foundation_page_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        foundation_page_id = response.data['id']
+        response = self.client.get(self.urls['timeline'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['timeline']), 3)
         
-        # Step 2: First Collaborator adds content
-        self.client.force_authenticate(user=self.collaborator1)
+        response = self.client.get(self.urls['search'], {'q': 'technology'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(response.data['results']), 0)
+    
+    def test_collaboration_aggregates_are_cached_until_world_changes(self):
+        """Test contributors responses are served from cache until content changes."""
+        contributors_url = self.urls['contributors']
         
-        magic_character_data = {
-            'title': 'Master Technomancer',
-            'content': 'A master of both magical and technological arts, representing the perfect balance that this world strives for.',
-            'full_name': 'Zara Gearwright',
-            'species': 'Human',
-            'occupation': 'Technomancer',
-            'personality_traits': ['innovative', 'balanced', 'wise', 'curious'],
-            'relationships': {
-                'mentor': 'Young technomancers',
-                'colleague': 'Magic Council',
-                'inventor': 'Magical devices'
-            },
-            'tags': ['magic', 'technology', 'balance', 'master']
-        }
+        response = self.client.get(contributors_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['collaboration_summary']['total_cross_author_links'], 0)
         
-        response = self.client.post(f'/api/worlds/{world_id}/characters/', magic_character_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        character_id = response.data['id']
+        # Repeat requests only load the world
+        with self.assertNumQueries(1):
+            response = self.client.get(contributors_url)
+        self.assertEqual(response.data['collaboration_summary']['total_cross_author_links'], 0)
         
-        # Link character to foundation page
-        link_data = {
-            'links': [
-                {
-                    'content_type': 'page',
-                    'content_id': foundation_page_id
-                }
-            ]
-        }
+        # Linking content bumps the world's cache version and invalidates the cache
+        self.character.link_to(self.page)
+        response = self.client.get(contributors_url)
+        self.assertEqual(response.data['collaboration_summary']['total_cross_author_links'], 2)
+    
+    def test_cross_author_links_skip_same_author_links(self):
+        """Test only links between different authors count as cross-author links."""
+        appendix = self._create_content(Page, {
+            'title': 'Foundation Appendix',
+            'content': 'Further notes on the balance between magic and technology.',
+            'tags': ['foundation']
+        }, author=self.creator)
+        appendix.link_to(self.page)
+        self.character.link_to(self.page)
+        
+        # Each link is stored in both directions
+        response = self.client.get(self.urls['contributors'])
+        self.assertEqual(response.data['collaboration_summary']['total_cross_author_links'], 2)
+    
+    def test_cached_aggregates_follow_world_updates(self):
+        """Test editing the world invalidates the cached contributors and attribution report."""
+        self.assertEqual(self.client.get(self.urls['contributors']).data['world']['title'], self.WORLD_TITLE)
+        self.assertEqual(self.client.get(self.urls['attribution-report']).data['world']['title'], self.WORLD_TITLE)
         
-        response = self.client.post(f'/api/worlds/{world_id}/characters/{character_id}/add-links/', link_data, format='json')
+        response = self.client.patch(
+            reverse('world-detail', kwargs={'pk': self.world.id}), {'title': 'Renamed World'}, format='json'
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Step 3: Second Collaborator adds content
-        self.client.force_authenticate(user=self.collaborator2)
-        
-        story_data = {
-            'title': 'The Great Convergence',
-            'content': 'The story of how magic and technology first came together, told through the eyes of Zara Gearwright as she discovers the ancient principles that would shape the world.',
-            'genre': 'Fantasy',
-            'main_characters': ['Zara Gearwright', 'Ancient Spirits', 'Tech Innovators'],
-            'tags': ['magic', 'technology', 'convergence', 'history']
-        }
+        self.assertEqual(self.client.get(self.urls['contributors']).data['world']['title'], 'Renamed World')
+        self.assertEqual(self.client.get(self.urls['attribution-report']).data['world']['title'], 'Renamed World')
+    
+    def test_cached_aggregates_leave_updated_at_alone(self):
+        """Test invalidating cached aggregates does not touch the world's updated_at."""
+        updated_at = World.objects.get(pk=self.world.pk).updated_at
+        self.character.link_to(self.page)
+        self.page.soft_delete(self.creator)
+        self.page.restore()
+        self.assertEqual(World.objects.get(pk=self.world.pk).updated_at, updated_at)
+    
+    def test_cached_contributors_follow_username_changes(self):
+        """Test renaming a contributor invalidates the worlds they contributed to."""
+        response = self.client.get(self.urls['contributors'])
+        usernames = {contributor['username'] for contributor in response.data['contributors']}
+        self.assertIn('collab1', usernames)
+        
+        self.collaborator1.username = 'collab1-renamed'
+        self.collaborator1.save()
+        response = self.client.get(self.urls['contributors'])
+        usernames = {contributor['username'] for contributor in response.data['contributors']}
+        self.assertIn('collab1-renamed', usernames)
+        self.assertNotIn('collab1', usernames)
+    
+    def test_cached_contributors_follow_hard_deletes(self):
+        """Test hard deleting content invalidates its world's cached aggregates."""
+        response = self.client.get(self.urls['contributors'])
+        self.assertEqual(response.data['total_contributors'], 3)
+        
+        # Queryset deletes bypass the immutable delete() but still send post_delete
+        Character.all_objects.filter(pk=self.character.pk).delete()
+        response = self.client.get(self.urls['contributors'])
+        self.assertEqual(response.data['total_contributors'], 2)
+    
+    def test_attribution_report_is_cached_until_world_changes(self):
+        """Test the attribution network is rebuilt only after a link changes the world."""
+        report_url = self.urls['attribution-report']
         
-        response = self.client.post(f'/api/worlds/{world_id}/stories/', story_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        story_id = response.data['id']
+        response = self.client.get(report_url)
+        self.assertEqual(response.data['attribution_network']['collab1']['references_to_others'], 0)
         
-        # Link story to both character and foundation page
-        link_data = {
-            'links': [
-                {
-                    'content_type': 'character',
-                    'content_id': character_id
-                },
-                {
-                    'content_type': 'page',
-                    'content_id': foundation_page_id
-                }
-            ]
-        }
+        with self.assertNumQueries(1):
+            response = self.client.get(report_url)
+        self.assertEqual(response.data['attribution_network']['collab1']['references_to_others'], 0)
         
-        response = self.client.post(f'/api/worlds/{world_id}/stories/{story_id}/add-links/', link_data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.character.link_to(self.page)
+        response = self.client.get(report_url)
+        self.assertEqual(response.data['attribution_network']['collab1']['references_to_others'], 1)
+        self.assertEqual(response.data['attribution_network']['collab1']['collaborates_with'], ['worldcreator'])
+    
+    async def test_read_only_collaboration_endpoints_concurrently(self):
+        """Test the read-only collaboration endpoints answer concurrent requests over ASGI."""
+        await sync_to_async(self.character.link_to)(self.page)
+        await sync_to_async(self.story.link_to)(self.character)
+        
+        # AsyncClient has no force_authenticate, so send a real access token
+        client = AsyncClient()
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(self.creator)}'}
+        
+        contributors, report, details, timeline, search = await asyncio.gather(
+            client.get(self.urls['contributors'], headers=headers),
+            client.get(self.urls['attribution-report'], headers=headers),
+            client.get(self.urls['story-attribution-details'], headers=headers),
+            client.get(self.urls['timeline'], headers=headers),
+            client.get(self.urls['search'], {'q': 'technology'}, headers=headers),
+        )
         
-        # Step 4: Test Collaboration Statistics
-        self.client.force_authenticate(user=self.creator)
+        for response in (contributors, report, details, timeline, search):
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
         
-        # Check world contributors
-        response = self.client.get(f'/api/worlds/{world_id}/contributors/')
+        self.assertEqual(contributors.json()['total_contributors'], 3)
+        self.assertGreater(report.json()['collaboration_metrics']['total_cross_references'], 0)
+        self.assertTrue(details.json()['collaboration_metrics']['is_collaborative'])
+        self.assertEqual(len(timeline.json()['timeline']), 3)
+        self.assertGreater(len(search.json()['results']), 0)
+
+
+class CollaborationEndpointsTest(CollaborativeWorldFixture):
+    """
+    Test each collaboration endpoint against a world with cross-author links.
+    The endpoints are called through their viewsets directly; URL routing and
+    middleware are covered by CompleteCollaborativeWorkflowTest.
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Link the collaborators' content once for the class."""
+        super().setUpTestData()
+        cls.character.link_to(cls.page)
+        cls.story.link_to(cls.character)
+        cls.story.link_to(cls.page)
+    
+    def _get(self, viewset, action, params=None, **kwargs):
+        """Dispatch a GET as the world creator straight to a viewset action."""
+        return dispatch_to_viewset(viewset, 'get', action, params, user=self.creator, **kwargs)
+    
+    def test_contributors(self):
+        """Test the contributors endpoint lists every author and cross-author links."""
+        with self.assertNumQueries(8):
+            response = self._get(WorldViewSet, 'contributors', pk=self.world.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         contributors_data = response.data
+        self.assertEqual(set(contributors_data), self.CONTRIBUTORS_KEYS)
+        self.assertEqual(set(contributors_data['collaboration_summary']), self.COLLABORATION_SUMMARY_KEYS)
         self.assertEqual(contributors_data['total_contributors'], 3)
-        
-        # Verify all users are listed as contributors
-        contributor_usernames = [c['username'] for c in contributors_data['contributors']]
-        self.assertIn('worldcreator', contributor_usernames)
-        self.assertIn('collab1', contributor_usernames)
-        self.assertIn('collab2', contributor_usernames)
-        
-        # Check collaboration metrics
-        self.assertIn('collaboration_summary', contributors_data)
+        usernames = {contributor['username'] for contributor in contributors_data['contributors']}
+        self.assertEqual(usernames, {'worldcreator', 'collab1', 'collab2'})
         self.assertGreater(contributors_data['collaboration_summary']['total_cross_author_links'], 0)
-        
-        # Step 5: Test Attribution Report
-        response = self.client.get(f'/api/worlds/{world_id}/attribution_report/')
+    
+    def test_attribution_report(self):
+        """Test the attribution report describes the world's collaboration health."""
+        with self.assertNumQueries(7):
+            response = self._get(WorldViewSet, 'attribution_report', pk=self.world.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         attribution_data = response.data
-        self.assertIn('attribution_network', attribution_data)
-        self.assertIn('attribution_quality', attribution_data)
-
-        # Verify collaboration health is positive
-        collab_health = attribution_data['attribution_quality'].get('collaboration_health')
-        self.assertIsNotNone(collab_health)
-        
-        # Step 6: Test Content Attribution Details
-        response = self.client.get(f'/api/worlds/{world_id}/stories/{story_id}/attribution_details/')
+        self.assertEqual(set(attribution_data), self.ATTRIBUTION_REPORT_KEYS)
+        self.assertEqual(set(attribution_data['attribution_quality']), self.ATTRIBUTION_QUALITY_KEYS)
+        self.assertIsNotNone(attribution_data['attribution_quality']['collaboration_health'])
+    
+    def test_story_attribution_details(self):
+        """Test attribution details detect the story's cross-author references."""
+        with self.assertNumQueries(11):
+            response = self._get(StoryViewSet, 'attribution_details', world_pk=self.world.id, pk=self.story.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         attribution_details = response.data
-        self.assertIn('collaboration_metrics', attribution_details)
+        self.assertEqual(set(attribution_details), self.ATTRIBUTION_DETAILS_KEYS)
+        self.assertEqual(set(attribution_details['collaboration_metrics']), self.COLLABORATION_METRICS_KEYS)
         
-        # Verify cross-author references are detected
         collab_metrics = attribution_details['collaboration_metrics']
         self.assertTrue(collab_metrics['is_collaborative'])
         self.assertGreater(collab_metrics['cross_author_references_made'] + collab_metrics['cross_author_references_received'], 0)
-        
-        # Step 7: Test Timeline with Multiple Authors
-        response = self.client.get(f'/api/worlds/{world_id}/timeline/')
+    
+    def test_timeline(self):
+        """Test the timeline includes content from all three authors."""
+        with self.assertNumQueries(9):
+            response = self._get(WorldViewSet, 'timeline', pk=self.world.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         timeline = response.data['timeline']
         self.assertEqual(len(timeline), 3)  # page, character, story
-        
-        # Verify different authors in timeline
-        authors = [item['author']['username'] for item in timeline]
-        self.assertEqual(len(set(authors)), 3)  # Three different authors
-        
-        # Step 8: Test Search Across Collaborative Content
-        response = self.client.get(f'/api/worlds/{world_id}/search/', {'q': 'technology'})
+        self.assertEqual(len({item['author']['username'] for item in timeline}), 3)
+    
+    def test_search(self):
+        """Test search finds matching content from more than one author."""
+        with self.assertNumQueries(8):
+            response = self._get(WorldViewSet, 'search', {'q': 'technology'}, pk=self.world.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         search_results = response.data['results']
         self.assertGreater(len(search_results), 0)
-        
-        # Verify search finds content from multiple authors
-        search_authors = [result['author']['username'] for result in search_results]
-        self.assertGreater(len(set(search_authors)), 1)
-        
-        return world_id, foundation_page_id, character_id, story_id
\ No newline at end of file
+        self.assertGreater(len({result['author']['username'] for result in search_results}), 1)
@@ -2,27 +2,39 @@
 Unit tests for models in the collaborative worldbuilding application.
 Tests model validation, constraints, and business logic.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from datetime import timedelta
+from io import BytesIO
+from PIL import Image as PILImage
 from .models import (
     UserProfile, World, Page, Essay, Character, Story, Image, 
     Tag, ContentTag, ContentLink
 )
 from .exceptions import ImmutabilityViolationError, ContentValidationError
+from .factories import BaseWorldFixture, PageFactory, TagFactory, WorldFactory
+
+
+# Shared literals, built once at import
+LONG_TITLE = 'A' * 301  # One character over the 300 character title limit
+TEN_WORD_TEXT = 'This is a test essay with exactly ten words here.'
+NINE_WORD_TEXT = 'This is a short story with exactly eight words.'
 
 
 class UserProfileModelTest(TestCase):
     """Test UserProfile model validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
-            password='testpass123',
             first_name='Test',
             last_name='User'
         )
@@ -62,12 +74,12 @@ class UserProfileModelTest(TestCase):
 class WorldModelTest(TestCase):
     """Test World model validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
-            email='test@example.com',
-            password='testpass123'
+            email='test@example.com'
         )
     
     def test_world_creation(self):
@@ -95,35 +107,6 @@ class WorldModelTest(TestCase):
         )
         self.assertEqual(str(world), 'Test World')
     
-    def test_world_title_validation(self):
-        """Test world title validation."""
-        # Test empty title
-        with self.assertRaises(ValidationError):
-            world = World(
-                title='',
-                description='A test world',
-                creator=self.user
-            )
-            world.full_clean()
-        
-        # Test short title
-        with self.assertRaises(ValidationError):
-            world = World(
-                title='AB',  # Too short
-                description='A test world',
-                creator=self.user
-            )
-            world.full_clean()
-        
-        # Test whitespace-only title
-        with self.assertRaises(ValidationError):
-            world = World(
-                title='   ',
-                description='A test world',
-                creator=self.user
-            )
-            world.full_clean()
-    
     def test_world_creator_profile_update(self):
         """Test that creating a world updates creator's profile."""
         # Ensure profile exists
@@ -143,48 +126,35 @@ class WorldModelTest(TestCase):
     
     def test_world_ordering(self):
         """Test that worlds are ordered by creation date (newest first)."""
-        import time
-        
         world1 = World.objects.create(
             title='First World',
             description='First world',
             creator=self.user
         )
-        
-        # Small delay to ensure different timestamps
-        time.sleep(0.01)
-        
         world2 = World.objects.create(
             title='Second World',
             description='Second world',
             creator=self.user
         )
         
+        # Pin distinct timestamps instead of sleeping between the creates
+        World.objects.filter(pk=world1.pk).update(created_at=timezone.now() - timedelta(seconds=1))
+        
         worlds = list(World.objects.all())
         # Should be ordered by creation date (newest first)
-        self.assertTrue(worlds[0].created_at >= worlds[1].created_at)
+        self.assertEqual(worlds, [world2, world1])
 
 
-class ContentBaseModelTest(TestCase):
+class ContentBaseModelTest(BaseWorldFixture):
     """Test ContentBase model validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user1 = User.objects.create_user(
-            username='testuser1',
-            email='test1@example.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='testuser2',
-            email='test2@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user1
-        )
+    USERNAMES = ('testuser1', 'testuser2')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        cls.user1, cls.user2 = cls.users
     
     def test_page_creation(self):
         """Test that pages are created correctly."""
@@ -203,61 +173,6 @@ class ContentBaseModelTest(TestCase):
         self.assertEqual(page.summary, 'Test summary')
         self.assertIsNotNone(page.created_at)
     
-    def test_content_validation_empty_title(self):
-        """Test validation for empty title."""
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='',
-                content='Valid content',
-                author=self.user1,
-                world=self.world
-            )
-            page.full_clean()
-    
-    def test_content_validation_short_title(self):
-        """Test validation for short title."""
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='AB',  # Too short
-                content='Valid content',
-                author=self.user1,
-                world=self.world
-            )
-            page.full_clean()
-    
-    def test_content_validation_long_title(self):
-        """Test validation for overly long title."""
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='A' * 301,  # Too long
-                content='Valid content',
-                author=self.user1,
-                world=self.world
-            )
-            page.full_clean()
-    
-    def test_content_validation_empty_content(self):
-        """Test validation for empty content."""
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='Valid Title',
-                content='',
-                author=self.user1,
-                world=self.world
-            )
-            page.full_clean()
-    
-    def test_content_validation_short_content(self):
-        """Test validation for short content."""
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='Valid Title',
-                content='Short',  # Too short
-                author=self.user1,
-                world=self.world
-            )
-            page.full_clean()
-    
     def test_duplicate_title_validation(self):
         """Test validation for duplicate titles within same world."""
         # Create first page
@@ -308,99 +223,85 @@ class ContentBaseModelTest(TestCase):
         self.assertEqual(profile.contribution_count, initial_count + 1)
 
 
-class ImmutabilityModelTest(TestCase):
+class ImmutabilityModelTest(BaseWorldFixture):
     """Test immutability enforcement in content models."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
+    @classmethod
+    def setUpTestData(cls):
+        """Set up one persisted entry per content type, shared by every test in the class."""
+        super().setUpTestData()
+        cls.page = Page.objects.create(
+            title='Test Page',
+            content='Original content',
+            author=cls.user,
+            world=cls.world
         )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
+        cls.essay = Essay.objects.create(
+            title='Test Essay',
+            content='Original essay content',
+            author=cls.user,
+            world=cls.world
+        )
+        cls.character = Character.objects.create(
+            title='Test Character',
+            content='Character description',
+            author=cls.user,
+            world=cls.world,
+            full_name='John Doe',
+            personality_traits=['brave'],
+            relationships={'friend': 'Alice'}
+        )
+        cls.story = Story.objects.create(
+            title='Test Story',
+            content='Story content',
+            author=cls.user,
+            world=cls.world,
+            main_characters=['Hero']
         )
     
     def test_page_immutability_update(self):
         """Test that pages cannot be updated after creation."""
-        page = Page.objects.create(
-            title='Test Page',
-            content='Original content',
-            author=self.user,
-            world=self.world
-        )
-        
-        # Try to update the page
-        page.title = 'Updated Title'
+        self.page.title = 'Updated Title'
         with self.assertRaises(ImmutabilityViolationError):
-            page.save()
+            self.page.save()
     
     def test_page_immutability_delete(self):
         """Test that pages cannot be deleted."""
-        page = Page.objects.create(
-            title='Test Page',
-            content='Test content',
-            author=self.user,
-            world=self.world
-        )
-        
-        # Try to delete the page
         with self.assertRaises(ImmutabilityViolationError):
-            page.delete()
+            self.page.delete()
+        self.assertTrue(Page.objects.filter(pk=self.page.pk).exists())
     
     def test_essay_immutability(self):
         """Test that essays are immutable."""
-        essay = Essay.objects.create(
-            title='Test Essay',
-            content='Original essay content',
-            author=self.user,
-            world=self.world
-        )
-        
-        # Try to update
-        essay.content = 'Updated content'
+        self.essay.content = 'Updated content'
         with self.assertRaises(ImmutabilityViolationError):
-            essay.save()
+            self.essay.save()
     
     def test_character_immutability(self):
         """Test that characters are immutable."""
-        character = Character.objects.create(
-            title='Test Character',
-            content='Character description',
-            author=self.user,
-            world=self.world,
-            full_name='John Doe',
-            personality_traits=['brave'],
-            relationships={'friend': 'Alice'}
-        )
-        
-        # Try to update
-        character.full_name = 'Jane Doe'
+        self.character.full_name = 'Jane Doe'
         with self.assertRaises(ImmutabilityViolationError):
-            character.save()
+            self.character.save()
     
     def test_story_immutability(self):
         """Test that stories are immutable."""
-        story = Story.objects.create(
-            title='Test Story',
-            content='Story content',
-            author=self.user,
-            world=self.world,
-            main_characters=['Hero']
-        )
-        
-        # Try to update
-        story.genre = 'Updated Genre'
+        self.story.genre = 'Updated Genre'
         with self.assertRaises(ImmutabilityViolationError):
-            story.save()
+            self.story.save()
     
     def test_image_immutability(self):
         """Test that images are immutable."""
-        # Skip this test as it requires actual file handling
-        self.skipTest("Image immutability test requires file handling setup")
+        # Test settings keep uploads in InMemoryStorage
+        image_io = BytesIO()
+        PILImage.new('RGB', (50, 50), color='red').save(image_io, format='PNG')
+        image = Image.objects.create(
+            title='Test Image',
+            content='Image description',
+            author=self.user,
+            world=self.world,
+            image_file=SimpleUploadedFile('test_image.png', image_io.getvalue(), content_type='image/png'),
+            alt_text='A red square'
+        )
         
         # Try to update
         image.alt_text = 'Updated alt text'
@@ -410,7 +311,7 @@ class ImmutabilityModelTest(TestCase):
     def test_force_update_bypass(self):
         """Test that force_update=True bypasses immutability."""
         page = Page.objects.create(
-            title='Test Page',
+            title='Force Update Page',
             content='Original content',
             author=self.user,
             world=self.world
@@ -424,32 +325,12 @@ class ImmutabilityModelTest(TestCase):
         self.assertEqual(page.title, 'Force Updated Title')
 
 
-class SpecificContentModelTest(TestCase):
+class SpecificContentModelTest(BaseWorldFixture):
     """Test specific content model functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_essay_word_count_calculation(self):
-        """Test that essay word count is calculated automatically."""
-        essay = Essay.objects.create(
-            title='Test Essay',
-            content='This is a test essay with exactly ten words here.',
-            author=self.user,
-            world=self.world
-        )
-        
-        self.assertEqual(essay.word_count, 10)
+        """Test the word count essays compute on save."""
+        self.assertEqual(Essay._compute_word_count(TEN_WORD_TEXT), 10)
     
     def test_character_full_name_validation(self):
         """Test character full name validation."""
@@ -479,16 +360,9 @@ class SpecificContentModelTest(TestCase):
         self.assertEqual(character.relationships, {'friend': 'Alice', 'mentor': 'Bob'})
     
     def test_story_word_count_calculation(self):
-        """Test that story word count is calculated automatically."""
-        story = Story.objects.create(
-            title='Test Story',
-            content='This is a short story with exactly eight words.',
-            author=self.user,
-            world=self.world,
-            main_characters=['Hero']
-        )
-        
-        self.assertEqual(story.word_count, 9)  # "This is a short story with exactly eight words." = 9 words
+        """Test the word count stories compute on save."""
+        self.assertEqual(Story._compute_word_count(NINE_WORD_TEXT), 9)
+        self.assertEqual(Story._compute_word_count('  spaced\n\tout  words '), 3)
     
     def test_story_json_fields(self):
         """Test story JSON field handling."""
@@ -503,22 +377,9 @@ class SpecificContentModelTest(TestCase):
         self.assertEqual(story.main_characters, ['Hero', 'Villain', 'Sidekick'])
 
 
-class TagModelTest(TestCase):
+class TagModelTest(BaseWorldFixture):
     """Test Tag model validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_tag_creation(self):
         """Test that tags are created correctly."""
         tag = Tag.objects.create(
@@ -530,25 +391,6 @@ class TagModelTest(TestCase):
         self.assertEqual(tag.world, self.world)
         self.assertIsNotNone(tag.created_at)
     
-    def test_tag_name_normalization(self):
-        """Test that tag names are normalized to lowercase."""
-        tag = Tag(
-            name='  FANTASY  ',
-            world=self.world
-        )
-        tag.full_clean()
-        
-        self.assertEqual(tag.name, 'fantasy')
-    
-    def test_tag_empty_name_validation(self):
-        """Test validation for empty tag name."""
-        with self.assertRaises(ValidationError):
-            tag = Tag(
-                name='',
-                world=self.world
-            )
-            tag.full_clean()
-    
     def test_tag_uniqueness_within_world(self):
         """Test that tag names are unique within a world."""
         # Create first tag
@@ -597,36 +439,29 @@ class TagModelTest(TestCase):
         self.assertEqual(tag.get_usage_count(), 1)
 
 
-class ContentTagModelTest(TestCase):
+class ContentTagModelTest(BaseWorldFixture):
     """Test ContentTag model functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        self.page = Page.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        cls.page = Page.objects.create(
             title='Test Page',
             content='Test content',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
-        self.tag = Tag.objects.create(
+        cls.tag = Tag.objects.create(
             name='fantasy',
-            world=self.world
+            world=cls.world
         )
+        cls.page_ct = ContentType.objects.get_for_model(Page)
     
     def test_content_tag_creation(self):
         """Test that content tags are created correctly."""
         content_tag = ContentTag.objects.create(
-            content_type=ContentType.objects.get_for_model(Page),
+            content_type=self.page_ct,
             object_id=self.page.id,
             tag=self.tag
         )
@@ -639,54 +474,49 @@ class ContentTagModelTest(TestCase):
         """Test that content-tag relationships are unique."""
         # Create first content tag
         ContentTag.objects.create(
-            content_type=ContentType.objects.get_for_model(Page),
+            content_type=self.page_ct,
             object_id=self.page.id,
             tag=self.tag
         )
         
-        # Try to create duplicate
-        with self.assertRaises(IntegrityError):
+        # Try to create duplicate; the atomic block keeps the failed INSERT
+        # from breaking the test's transaction
+        with self.assertRaises(IntegrityError), transaction.atomic():
             ContentTag.objects.create(
-                content_type=ContentType.objects.get_for_model(Page),
+                content_type=self.page_ct,
                 object_id=self.page.id,
                 tag=self.tag
             )
+        self.assertEqual(ContentTag.objects.filter(tag=self.tag).count(), 1)
 
 
-class ContentLinkModelTest(TestCase):
+class ContentLinkModelTest(BaseWorldFixture):
     """Test ContentLink model functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        self.page1 = Page.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        cls.page1 = Page.objects.create(
             title='Test Page 1',
             content='Test content 1',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
-        self.page2 = Page.objects.create(
+        cls.page2 = Page.objects.create(
             title='Test Page 2',
             content='Test content 2',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
+        cls.page_ct = ContentType.objects.get_for_model(Page)
     
     def test_content_link_creation(self):
         """Test that content links are created correctly."""
         link = ContentLink.objects.create(
-            from_content_type=ContentType.objects.get_for_model(Page),
+            from_content_type=self.page_ct,
             from_object_id=self.page1.id,
-            to_content_type=ContentType.objects.get_for_model(Page),
+            to_content_type=self.page_ct,
             to_object_id=self.page2.id
         )
         
@@ -698,9 +528,9 @@ class ContentLinkModelTest(TestCase):
         """Test that content cannot link to itself."""
         with self.assertRaises(ValidationError):
             link = ContentLink(
-                from_content_type=ContentType.objects.get_for_model(Page),
+                from_content_type=self.page_ct,
                 from_object_id=self.page1.id,
-                to_content_type=ContentType.objects.get_for_model(Page),
+                to_content_type=self.page_ct,
                 to_object_id=self.page1.id  # Same as from_object_id
             )
             link.full_clean()
@@ -709,49 +539,41 @@ class ContentLinkModelTest(TestCase):
         """Test that content links are unique."""
         # Create first link
         ContentLink.objects.create(
-            from_content_type=ContentType.objects.get_for_model(Page),
+            from_content_type=self.page_ct,
             from_object_id=self.page1.id,
-            to_content_type=ContentType.objects.get_for_model(Page),
+            to_content_type=self.page_ct,
             to_object_id=self.page2.id
         )
         
         # Try to create duplicate
         with self.assertRaises(ValidationError):
             link = ContentLink(
-                from_content_type=ContentType.objects.get_for_model(Page),
+                from_content_type=self.page_ct,
                 from_object_id=self.page1.id,
-                to_content_type=ContentType.objects.get_for_model(Page),
+                to_content_type=self.page_ct,
                 to_object_id=self.page2.id
             )
             link.full_clean()
 
 
-class ContentMethodsTest(TestCase):
+class ContentMethodsTest(BaseWorldFixture):
     """Test content model methods for tagging and linking."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        self.page1 = Page.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        cls.page1 = Page.objects.create(
             title='Test Page 1',
             content='Test content 1',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
-        self.page2 = Page.objects.create(
+        cls.page2 = Page.objects.create(
             title='Test Page 2',
             content='Test content 2',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
     
     def test_add_tag_method(self):
@@ -764,9 +586,7 @@ class ContentMethodsTest(TestCase):
         self.assertEqual(content_tag.tag.name, 'fantasy')
         
         # Verify tag appears in content's tags
-        tags = self.page1.get_tags()
-        self.assertEqual(tags.count(), 1)
-        self.assertEqual(tags.first().name, 'fantasy')
+        self.assertEqual([tag.name for tag in self.page1.get_tags()], ['fantasy'])
     
     def test_add_multiple_tags_method(self):
         """Test adding multiple tags to content."""
@@ -777,12 +597,24 @@ class ContentMethodsTest(TestCase):
         self.assertEqual(len(content_tags), 3)
         
         # Verify tags appear in content's tags
-        tags = self.page1.get_tags()
-        self.assertEqual(tags.count(), 3)
-        tag_names = [tag.name for tag in tags]
-        self.assertIn('fantasy', tag_names)
-        self.assertIn('adventure', tag_names)
-        self.assertIn('magic', tag_names)
+        tag_names = [tag.name for tag in self.page1.get_tags()]
+        self.assertCountEqual(tag_names, ['fantasy', 'adventure', 'magic'])
+    
+    def test_add_tags_inserts_in_bulk(self):
+        """Test add_tags reuses existing tags and batches its inserts."""
+        self.page1.add_tag('fantasy')
+        ContentType.objects.get_for_model(Page)
+        
+        # Tag insert, tag select, content-tag insert, content-tag select
+        with self.assertNumQueries(4):
+            content_tags = self.page1.add_tags('Fantasy, adventure, magic, adventure')
+        
+        self.assertEqual(
+            [content_tag.tag.name for content_tag in content_tags],
+            ['fantasy', 'adventure', 'magic', 'adventure']
+        )
+        self.assertEqual(Tag.objects.filter(world=self.world).count(), 3)
+        self.assertEqual(self.page1.get_tags().count(), 3)
     
     def test_remove_tag_method(self):
         """Test removing tags from content."""
@@ -861,17 +693,11 @@ class ContentMethodsTest(TestCase):
         self.page2.add_tag('adventure')
         
         # Get content by tag
-        fantasy_pages = Page.get_content_by_tag(self.world, 'fantasy')
-        self.assertEqual(fantasy_pages.count(), 1)
-        self.assertEqual(fantasy_pages.first(), self.page1)
-        
-        adventure_pages = Page.get_content_by_tag(self.world, 'adventure')
-        self.assertEqual(adventure_pages.count(), 1)
-        self.assertEqual(adventure_pages.first(), self.page2)
+        self.assertEqual(list(Page.get_content_by_tag(self.world, 'fantasy')), [self.page1])
+        self.assertEqual(list(Page.get_content_by_tag(self.world, 'adventure')), [self.page2])
         
         # Test non-existent tag
-        nonexistent_pages = Page.get_content_by_tag(self.world, 'nonexistent')
-        self.assertEqual(nonexistent_pages.count(), 0)
+        self.assertEqual(list(Page.get_content_by_tag(self.world, 'nonexistent')), [])
     
     def test_get_content_by_tags_class_method(self):
         """Test getting content by multiple tags using class method."""
@@ -884,11 +710,61 @@ class ContentMethodsTest(TestCase):
         fantasy_or_adventure = Page.get_content_by_tags(
             self.world, ['fantasy', 'adventure'], match_all=False
         )
-        self.assertEqual(fantasy_or_adventure.count(), 2)
+        self.assertCountEqual(fantasy_or_adventure, [self.page1, self.page2])
         
         # Test match_all=True (all tags)
         fantasy_and_adventure = Page.get_content_by_tags(
             self.world, ['fantasy', 'adventure'], match_all=True
         )
-        self.assertEqual(fantasy_and_adventure.count(), 1)
-        self.assertEqual(fantasy_and_adventure.first(), self.page1)
\ No newline at end of file
+        self.assertEqual(list(fantasy_and_adventure), [self.page1])
+
+class ModelValidationTest(SimpleTestCase):
+    """Test model validation rules on unsaved factory-built instances, without a database."""
+    
+    def full_clean(self, instance):
+        """Run full_clean() minus the foreign key and unique checks, which query the database."""
+        exclude = [field.name for field in instance._meta.fields if field.is_relation]
+        instance.full_clean(exclude=exclude, validate_unique=False)
+    
+    def test_world_title_validation(self):
+        """Test world title validation."""
+        for title in ('', 'AB', '   '):  # Empty, too short, whitespace only
+            with self.subTest(title=title), self.assertRaises(ValidationError):
+                self.full_clean(WorldFactory.build(title=title))
+    
+    def test_content_validation_empty_title(self):
+        """Test validation for empty title."""
+        with self.assertRaises(ContentValidationError):
+            self.full_clean(PageFactory.build(title=''))
+    
+    def test_content_validation_short_title(self):
+        """Test validation for short title."""
+        with self.assertRaises(ContentValidationError):
+            self.full_clean(PageFactory.build(title='AB'))
+    
+    def test_content_validation_long_title(self):
+        """Test validation for overly long title."""
+        with self.assertRaises(ContentValidationError):
+            self.full_clean(PageFactory.build(title=LONG_TITLE))
+    
+    def test_content_validation_empty_content(self):
+        """Test validation for empty content."""
+        with self.assertRaises(ContentValidationError):
+            self.full_clean(PageFactory.build(content=''))
+    
+    def test_content_validation_short_content(self):
+        """Test validation for short content."""
+        with self.assertRaises(ContentValidationError):
+            self.full_clean(PageFactory.build(content='Short'))
+    
+    def test_tag_name_normalization(self):
+        """Test that tag names are normalized to lowercase."""
+        tag = TagFactory.build(name='  FANTASY  ')
+        self.full_clean(tag)
+        
+        self.assertEqual(tag.name, 'fantasy')
+    
+    def test_tag_empty_name_validation(self):
+        """Test validation for empty tag name."""
+        with self.assertRaises(ValidationError):
+            self.full_clean(TagFactory.build(name=''))
@@ -2,7 +2,7 @@
 Unit tests for serializers in the collaborative worldbuilding application.
 Tests serializer validation, data transformation, and business logic.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from rest_framework.test import APIRequestFactory
 from rest_framework import serializers
@@ -13,6 +13,7 @@ from .serializers import (
     ContentBaseSerializer, PageSerializer, EssaySerializer,
     CharacterSerializer, StorySerializer, ImageSerializer
 )
+from .factories import BaseWorldFixture
 
 
 class UserRegistrationSerializerTest(TestCase):
@@ -20,7 +21,6 @@ class UserRegistrationSerializerTest(TestCase):
     
     def setUp(self):
         """Set up test data."""
-        self.factory = APIRequestFactory()
         self.valid_data = {
             'username': 'testuser',
             'email': 'test@example.com',
@@ -68,7 +68,13 @@ class UserRegistrationSerializerTest(TestCase):
         data['username'] = 'existing'
         serializer = UserRegistrationSerializer(data=data)
         self.assertFalse(serializer.is_valid())
-        self.assertIn('username', serializer.errors)
+        self.assertEqual(serializer.errors['username'], ['A user with that username already exists.'])
+    
+    def test_uniqueness_checked_once_per_field(self):
+        """Test username and email uniqueness cost one query each."""
+        serializer = UserRegistrationSerializer(data=self.valid_data)
+        with self.assertNumQueries(2):
+            self.assertTrue(serializer.is_valid())
     
     def test_email_validation(self):
         """Test email validation rules."""
@@ -93,37 +99,44 @@ class UserRegistrationSerializerTest(TestCase):
     
     def test_preferred_content_types_validation(self):
         """Test preferred content types validation."""
-        data = self.valid_data.copy()
-        data['preferred_content_types'] = ['page', 'invalid_type']
-        serializer = UserRegistrationSerializer(data=data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('preferred_content_types', serializer.errors)
+        invalid_values = [['page', 'invalid_type'], ['invalid_type'], ['Page']]
+        for value in invalid_values:
+            with self.subTest(preferred_content_types=value):
+                data = dict(self.valid_data, preferred_content_types=value)
+                serializer = UserRegistrationSerializer(data=data)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn('preferred_content_types', serializer.errors)
 
 
 class PasswordChangeSerializerTest(TestCase):
     """Test PasswordChangeSerializer validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    factory = APIRequestFactory()
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='oldpassword123'
         )
-        self.factory = APIRequestFactory()
-        
-    def test_valid_password_change(self):
-        """Test serializer with valid password change data."""
+    
+    def _context(self):
+        """Serializer context with a request made by the test user."""
         request = self.factory.post('/')
         request.user = self.user
-        
+        return {'request': request}
+    
+    def test_valid_password_change(self):
+        """Test serializer with valid password change data."""
         data = {
             'current_password': 'oldpassword123',
             'new_password': 'newpassword123',
             'new_password_confirm': 'newpassword123'
         }
         
-        serializer = PasswordChangeSerializer(data=data, context={'request': request})
+        serializer = PasswordChangeSerializer(data=data, context=self._context())
         self.assertTrue(serializer.is_valid())
         
         user = serializer.save()
@@ -131,50 +144,33 @@ class PasswordChangeSerializerTest(TestCase):
     
     def test_incorrect_current_password(self):
         """Test validation with incorrect current password."""
-        request = self.factory.post('/')
-        request.user = self.user
-        
         data = {
             'current_password': 'wrongpassword',
             'new_password': 'newpassword123',
             'new_password_confirm': 'newpassword123'
         }
         
-        serializer = PasswordChangeSerializer(data=data, context={'request': request})
+        serializer = PasswordChangeSerializer(data=data, context=self._context())
         self.assertFalse(serializer.is_valid())
         self.assertIn('current_password', serializer.errors)
     
     def test_new_password_confirmation(self):
         """Test new password confirmation validation."""
-        request = self.factory.post('/')
-        request.user = self.user
-        
         data = {
             'current_password': 'oldpassword123',
             'new_password': 'newpassword123',
             'new_password_confirm': 'different_password'
         }
         
-        serializer = PasswordChangeSerializer(data=data, context={'request': request})
+        serializer = PasswordChangeSerializer(data=data, context=self._context())
         self.assertFalse(serializer.is_valid())
         self.assertIn('new_password_confirm', serializer.errors)
 
 
-class WorldSerializerTest(TestCase):
+class WorldSerializerTest(BaseWorldFixture):
     """Test WorldSerializer validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    USERNAMES = ('testuser', 'testuser2')
     
     def test_world_serialization(self):
         """Test world serialization includes all expected fields."""
@@ -189,6 +185,77 @@ class WorldSerializerTest(TestCase):
         self.assertIn('collaboration_stats', data)
         self.assertIn('top_contributors', data)
     
+    def test_top_contributors_calculation(self):
+        """Test top contributors are ranked with their per-type counts."""
+        user2 = self.users[1]
+        page = Page.objects.create(
+            title='Page by User 1',
+            content='Content by user 1',
+            author=self.user,
+            world=self.world
+        )
+        essay = Essay.objects.create(
+            title='Essay by User 1',
+            content='Essay content by user 1',
+            author=self.user,
+            world=self.world
+        )
+        Page.objects.create(
+            title='Page by User 2',
+            content='Content by user 2',
+            author=user2,
+            world=self.world
+        )
+        
+        serializer = WorldSerializer(self.world)
+        with self.assertNumQueries(1):
+            top_contributors = serializer.get_top_contributors(self.world)
+        
+        self.assertEqual([c['username'] for c in top_contributors], ['testuser', 'testuser2'])
+        self.assertEqual(top_contributors[0], {
+            'id': self.user.id,
+            'username': 'testuser',
+            'first_name': '',
+            'last_name': '',
+            'full_name': 'testuser',
+            'contributions': {
+                'pages': 1, 'essays': 1, 'characters': 0, 'stories': 0, 'images': 0, 'total': 2
+            },
+            'first_contribution': page.created_at,
+            'last_contribution': essay.created_at,
+            'is_creator': True
+        })
+        self.assertFalse(top_contributors[1]['is_creator'])
+    
+    def test_top_contributors_skip_deleted_content(self):
+        """Test soft-deleted content is left out of contributor counts."""
+        Page.objects.create(
+            title='Page by User 1',
+            content='Content by user 1',
+            author=self.user,
+            world=self.world
+        )
+        deleted_page = Page.objects.create(
+            title='Deleted Page by User 1',
+            content='Deleted content by user 1',
+            author=self.user,
+            world=self.world
+        )
+        deleted_page.soft_delete(self.user)
+        removed = Page.objects.create(
+            title='Page by User 2',
+            content='Content by user 2',
+            author=self.users[1],
+            world=self.world
+        )
+        removed.soft_delete(self.users[1])
+        
+        top_contributors = WorldSerializer(self.world).get_top_contributors(self.world)
+        
+        self.assertEqual([c['username'] for c in top_contributors], ['testuser'])
+        self.assertEqual(top_contributors[0]['contributions']['pages'], 1)
+        self.assertEqual(top_contributors[0]['contributions']['total'], 1)
+    
     def test_content_counts_calculation(self):
         """Test content counts are calculated correctly."""
         # Create some content
@@ -205,23 +272,19 @@ class WorldSerializerTest(TestCase):
             world=self.world
         )
         
+        expected = {'pages': 1, 'essays': 1, 'characters': 0, 'stories': 0, 'images': 0}
         serializer = WorldSerializer(self.world)
-        content_counts = serializer.data['content_counts']
+        self.assertEqual(serializer.data['content_counts'], expected)
         
-        self.assertEqual(content_counts['pages'], 1)
-        self.assertEqual(content_counts['essays'], 1)
-        self.assertEqual(content_counts['characters'], 0)
-        self.assertEqual(content_counts['stories'], 0)
-        self.assertEqual(content_counts['images'], 0)
+        # Annotated worlds are counted by the query that loads them
+        with self.assertNumQueries(1):
+            world = WorldSerializer.annotate_counts(World.objects.filter(pk=self.world.pk)).get()
+            self.assertEqual(serializer.get_content_counts(world), expected)
     
     def test_contributor_count_calculation(self):
         """Test contributor count is calculated correctly."""
-        # Create another user and content
-        user2 = User.objects.create_user(
-            username='testuser2',
-            email='test2@example.com',
-            password='testpass123'
-        )
+        # Create content by both users
+        user2 = self.users[1]
         
         Page.objects.create(
             title='Page by User 1',
@@ -240,24 +303,16 @@ class WorldSerializerTest(TestCase):
         contributor_count = serializer.data['contributor_count']
         
         self.assertEqual(contributor_count, 2)
+        
+        # Annotated worlds are counted by the query that loads them
+        with self.assertNumQueries(1):
+            world = WorldSerializer.annotate_counts(World.objects.filter(pk=self.world.pk)).get()
+            self.assertEqual(serializer.get_contributor_count(world), 2)
 
 
-class TagSerializerTest(TestCase):
+class TagSerializerTest(BaseWorldFixture):
     """Test TagSerializer validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_tag_name_normalization(self):
         """Test that tag names are normalized during validation."""
         data = {'name': '  FANTASY  '}
@@ -284,34 +339,29 @@ class TagSerializerTest(TestCase):
         self.assertIn('name', serializer.errors)
 
 
-class ContentBaseSerializerTest(TestCase):
+class ContentBaseSerializerTest(BaseWorldFixture):
     """Test ContentBaseSerializer validation and functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            first_name='Test',
-            last_name='User'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        self.page = Page.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a page by a user with a full name."""
+        super().setUpTestData()
+        cls.user.first_name = 'Test'
+        cls.user.last_name = 'User'
+        cls.user.save(update_fields=['first_name', 'last_name'])
+        cls.page = Page.objects.create(
             title='Test Page',
             content='Test content for the page',
-            author=self.user,
-            world=self.world
+            author=cls.user,
+            world=cls.world
         )
     
     def test_content_serialization(self):
         """Test content serialization includes all expected fields."""
         serializer = PageSerializer(self.page)
-        data = serializer.data
+        # Tags and outgoing and incoming links, one query each
+        with self.assertNumQueries(3):
+            data = serializer.data
         
         self.assertEqual(data['title'], 'Test Page')
         self.assertEqual(data['content'], 'Test content for the page')
@@ -321,6 +371,14 @@ class ContentBaseSerializerTest(TestCase):
         self.assertIn('tags', data)
         self.assertIn('linked_content', data)
     
+    def test_serialization_leaves_instance_untouched(self):
+        """Test tags and links are prefetched on a copy, not on the caller's instance."""
+        PageSerializer(self.page).data
+        PageSerializer([self.page], many=True).data
+        
+        self.assertFalse(hasattr(self.page, 'prefetched_tag_links'))
+        self.assertFalse(hasattr(self.page, 'prefetched_outgoing_links'))
+    
     def test_attribution_field(self):
         """Test attribution field formatting."""
         serializer = PageSerializer(self.page)
@@ -332,7 +390,8 @@ class ContentBaseSerializerTest(TestCase):
     def test_collaboration_info_field(self):
         """Test collaboration info field calculation."""
         serializer = PageSerializer(self.page)
-        collab_info = serializer.data['collaboration_info']
+        with self.assertNumQueries(3):
+            collab_info = serializer.data['collaboration_info']
         
         self.assertIn('links_to_count', collab_info)
         self.assertIn('linked_from_count', collab_info)
@@ -340,6 +399,32 @@ class ContentBaseSerializerTest(TestCase):
         self.assertIn('is_collaborative', collab_info)
         self.assertIn('collaboration_score', collab_info)
     
+    def test_eager_loaded_serialization(self):
+        """Test eager loading gives the same data in a fixed number of queries."""
+        other_author = User.objects.create_user(username='otheruser')
+        character = Character.objects.create(
+            title='Linked Character',
+            content='A character linked from the page',
+            author=other_author,
+            world=self.world,
+            full_name='Linked Character'
+        )
+        self.page.add_tags(['fantasy', 'magic'])
+        self.page.link_to(character)
+        character.add_tags(['fantasy'])
+        
+        expected = PageSerializer(Page.objects.get(pk=self.page.pk)).data
+        
+        # Page row, tags, outgoing and incoming links, and the linked
+        # content with its authors
+        with self.assertNumQueries(8):
+            page = PageSerializer.setup_eager_loading(Page.objects.filter(pk=self.page.pk)).get()
+            data = PageSerializer(page).data
+        
+        self.assertEqual(data, expected)
+        self.assertEqual(data['collaboration_info']['references_other_authors'], ['otheruser'])
+        self.assertEqual([tag['usage_count'] for tag in data['tags']], [2, 1])
+    
     def test_title_validation(self):
         """Test title validation rules."""
         # Test empty title
@@ -375,22 +460,9 @@ class ContentBaseSerializerTest(TestCase):
         self.assertIn('content', serializer.errors)
 
 
-class PageSerializerTest(TestCase):
+class PageSerializerTest(BaseWorldFixture):
     """Test PageSerializer specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_page_summary_validation(self):
         """Test page summary validation."""
         data = {
@@ -412,22 +484,9 @@ class PageSerializerTest(TestCase):
         self.assertTrue(serializer.is_valid())
 
 
-class EssaySerializerTest(TestCase):
+class EssaySerializerTest(BaseWorldFixture):
     """Test EssaySerializer specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_essay_abstract_validation(self):
         """Test essay abstract validation."""
         data = {
@@ -455,21 +514,19 @@ class EssaySerializerTest(TestCase):
         self.assertIn('word_count', serializer.Meta.read_only_fields)
 
 
-class CharacterSerializerTest(TestCase):
+class CharacterSerializerTest(BaseWorldFixture):
     """Test CharacterSerializer specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    valid_data = {
+        'title': 'Test Character',
+        'content': 'Character description',
+        'full_name': 'John Doe'
+    }
+    
+    def test_valid_character_data(self):
+        """Test serializer with valid character data."""
+        serializer = CharacterSerializer(data=self.valid_data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
     
     def test_character_full_name_validation(self):
         """Test character full name validation."""
@@ -484,47 +541,28 @@ class CharacterSerializerTest(TestCase):
     
     def test_personality_traits_validation(self):
         """Test personality traits validation."""
-        # Test non-list value
-        data = {
-            'title': 'Test Character',
-            'content': 'Character description',
-            'full_name': 'John Doe',
-            'personality_traits': 'not a list'
-        }
-        serializer = CharacterSerializer(data=data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('personality_traits', serializer.errors)
+        # Test non-list values
+        for value in ['not a list', {'trait': 'brave'}, 42]:
+            with self.subTest(personality_traits=value):
+                data = dict(self.valid_data, personality_traits=value)
+                serializer = CharacterSerializer(data=data)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn('personality_traits', serializer.errors)
     
     def test_relationships_validation(self):
         """Test relationships validation."""
-        # Test non-dict value
-        data = {
-            'title': 'Test Character',
-            'content': 'Character description',
-            'full_name': 'John Doe',
-            'relationships': 'not a dict'
-        }
-        serializer = CharacterSerializer(data=data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('relationships', serializer.errors)
+        # Test non-dict values
+        for value in ['not a dict', ['friend'], 42]:
+            with self.subTest(relationships=value):
+                data = dict(self.valid_data, relationships=value)
+                serializer = CharacterSerializer(data=data)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn('relationships', serializer.errors)
 
 
-class StorySerializerTest(TestCase):
+class StorySerializerTest(BaseWorldFixture):
     """Test StorySerializer specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_main_characters_validation(self):
         """Test main characters validation."""
         # Test non-list value
@@ -554,21 +592,11 @@ class StorySerializerTest(TestCase):
         self.assertIn('word_count', serializer.Meta.read_only_fields)
 
 
-class ImageSerializerTest(TestCase):
-    """Test ImageSerializer specific functionality."""
-    
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+class ImageSerializerTest(SimpleTestCase):
+    """
+    Test ImageSerializer specific functionality.
+    Validation only; no database or file storage is touched.
+    """
     
     def test_alt_text_validation(self):
         """Test alt text validation for accessibility."""
@@ -590,37 +618,30 @@ class ImageSerializerTest(TestCase):
         self.assertIn('image_url', readonly_fields)
 
 
-class SerializerContextTest(TestCase):
+class SerializerContextTest(BaseWorldFixture):
     """Test serializer context handling."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
+    factory = APIRequestFactory()
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a page shared by every test in the class."""
+        super().setUpTestData()
+        cls.page = Page.objects.create(
+            title='Test Page',
+            content='Test content',
+            author=cls.user,
+            world=cls.world
         )
-        self.factory = APIRequestFactory()
     
     def test_serializer_with_request_context(self):
         """Test serializers work correctly with request context."""
         request = self.factory.get('/')
         request.user = self.user
         
-        page = Page.objects.create(
-            title='Test Page',
-            content='Test content',
-            author=self.user,
-            world=self.world
-        )
-        
-        serializer = PageSerializer(page, context={'request': request})
-        data = serializer.data
+        serializer = PageSerializer(self.page, context={'request': request})
+        with self.assertNumQueries(3):
+            data = serializer.data
         
         # Should include all expected fields
         self.assertIn('attribution', data)
@@ -629,14 +650,7 @@ class SerializerContextTest(TestCase):
     
     def test_serializer_without_request_context(self):
         """Test serializers work without request context."""
-        page = Page.objects.create(
-            title='Test Page',
-            content='Test content',
-            author=self.user,
-            world=self.world
-        )
-        
-        serializer = PageSerializer(page)
+        serializer = PageSerializer(self.page)
         data = serializer.data
         
         # Should still include all expected fields
@@ -2,93 +2,48 @@
 Comprehensive unit tests for the collaborative worldbuilding application.
 Focuses on core functionality, validation, and business logic.
 """
-from django.test import TestCase
+from datetime import timedelta
+
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.test import SimpleTestCase
 from django.core.exceptions import ValidationError
 from rest_framework.test import APIClient
 from rest_framework import status
 from .models import World, Page, Essay, Character, Story, Tag, UserProfile
 from .serializers import WorldSerializer, PageSerializer, EssaySerializer
+from .views import WorldViewSet, PageViewSet
 from .exceptions import ImmutabilityViolationError, ContentValidationError
+from .factories import BaseWorldFixture, dispatch_to_viewset
+
+
+# Bodies long enough to pass the content length validation
+PAGE_CONTENT = 'This is test content that meets minimum length requirements.'
+ESSAY_CONTENT = 'This is test essay content that meets minimum length requirements for essays.'
 
 
-class CoreModelValidationTest(TestCase):
+class CoreModelValidationTest(BaseWorldFixture):
     """Test core model validation and constraints."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            first_name='Test',
-            last_name='User'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world for validation testing',
-            creator=self.user
-        )
-    
     def test_world_validation(self):
         """Test world model validation."""
-        # Valid world
-        world = World(
-            title='Valid World',
-            description='Valid description',
-            creator=self.user
-        )
-        world.full_clean()  # Should not raise
-        
-        # Invalid world - empty title
-        with self.assertRaises(ValidationError):
-            world = World(
-                title='',
-                description='Valid description',
-                creator=self.user
-            )
-            world.full_clean()
-        
-        # Invalid world - short title
-        with self.assertRaises(ValidationError):
-            world = World(
-                title='AB',
-                description='Valid description',
-                creator=self.user
-            )
-            world.full_clean()
+        valid_kwargs = {
+            'title': 'Valid World',
+            'description': 'Valid description',
+            'creator': self.user,
+        }
+        World(**valid_kwargs).full_clean()  # Should not raise
     
     def test_page_validation(self):
         """Test page model validation."""
-        # Valid page
-        page = Page(
-            title='Valid Page Title',
-            content='This is valid content that meets the minimum length requirement.',
-            author=self.user,
-            world=self.world,
-            summary='Valid summary'
-        )
-        page.full_clean()  # Should not raise
-        
-        # Invalid page - empty title
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='',
-                content='Valid content that meets minimum length requirements.',
-                author=self.user,
-                world=self.world
-            )
-            page.full_clean()
-        
-        # Invalid page - short content
-        with self.assertRaises(ContentValidationError):
-            page = Page(
-                title='Valid Title',
-                content='Short',
-                author=self.user,
-                world=self.world
-            )
-            page.full_clean()
+        valid_kwargs = {
+            'title': 'Valid Page Title',
+            'content': 'This is valid content that meets the minimum length requirement.',
+            'author': self.user,
+            'world': self.world,
+            'summary': 'Valid summary',
+        }
+        Page(**valid_kwargs).full_clean()  # Should not raise
     
     def test_essay_validation(self):
         """Test essay model validation."""
@@ -102,34 +57,27 @@ class CoreModelValidationTest(TestCase):
         )
         essay.full_clean()  # Should not raise
         
-        # Word count should be calculated
-        essay.save()
-        self.assertGreater(essay.word_count, 0)
+        # Word count is computed from the content; test_essay_serializer
+        # covers it being stored on save
+        self.assertEqual(Essay._compute_word_count(essay.content), 13)
     
     def test_character_validation(self):
         """Test character model validation."""
-        # Valid character
-        character = Character(
-            title='Valid Character Title',
-            content='This is valid character content that meets minimum length requirements.',
-            author=self.user,
-            world=self.world,
-            full_name='John Doe',
-            personality_traits=['brave', 'kind'],
-            relationships={'friend': 'Alice'}
-        )
-        character.full_clean()  # Should not raise
+        valid_kwargs = {
+            'title': 'Valid Character Title',
+            'content': 'This is valid character content that meets minimum length requirements.',
+            'author': self.user,
+            'world': self.world,
+            'full_name': 'John Doe',
+            'personality_traits': ['brave', 'kind'],
+            'relationships': {'friend': 'Alice'},
+        }
+        Character(**valid_kwargs).full_clean()  # Should not raise
         
-        # Invalid character - empty full name
-        with self.assertRaises(ValidationError):
-            character = Character(
-                title='Valid Title',
-                content='Valid content that meets minimum length requirements.',
-                author=self.user,
-                world=self.world,
-                full_name=''
-            )
-            character.full_clean()
+        # Invalid characters - empty and blank full names
+        for overrides in [{'full_name': ''}, {'full_name': '   '}]:
+            with self.subTest(**overrides), self.assertRaises(ValidationError):
+                Character(**{**valid_kwargs, **overrides}).full_clean()
     
     def test_story_validation(self):
         """Test story model validation."""
@@ -144,57 +92,92 @@ class CoreModelValidationTest(TestCase):
         )
         story.full_clean()  # Should not raise
         
-        # Word count should be calculated
+        # Word count should be calculated and stored on save
         story.save()
-        self.assertGreater(story.word_count, 0)
+        story.refresh_from_db(fields=['word_count'])
+        self.assertEqual(story.word_count, 13)
     
     def test_tag_validation(self):
         """Test tag model validation."""
         # Valid tag
-        tag = Tag(
-            name='fantasy',
-            world=self.world
-        )
-        tag.full_clean()  # Should not raise
-        
-        # Tag name normalization
-        tag = Tag(
-            name='  ADVENTURE  ',
-            world=self.world
+        Tag(name='fantasy', world=self.world).full_clean()  # Should not raise
+
+
+class FieldValidationTest(SimpleTestCase):
+    """
+    Test validation rules that reject input before any database lookup.
+    Related objects are unsaved, so foreign key and uniqueness checks are
+    left to CoreModelValidationTest.
+    """
+    
+    user = User(pk=1, username='testuser')
+    world = World(pk=1, title='Test World', creator=user)
+    
+    def _full_clean(self, instance):
+        """Run full_clean() without the checks that query the database."""
+        instance.full_clean(
+            exclude=['creator', 'author', 'world'],
+            validate_unique=False,
+            validate_constraints=False,
         )
-        tag.full_clean()
+    
+    def test_world_validation(self):
+        """Test that empty and short world titles are rejected."""
+        for title in ['', 'AB']:
+            with self.subTest(title=title), self.assertRaises(ValidationError):
+                self._full_clean(World(title=title, description='Valid description', creator=self.user))
+    
+    def test_page_validation(self):
+        """Test that an empty title or short content is rejected."""
+        valid_kwargs = {
+            'title': 'Valid Page Title',
+            'content': 'This is valid content that meets the minimum length requirement.',
+            'author': self.user,
+            'world': self.world,
+        }
+        for overrides in [{'title': ''}, {'content': 'Short'}]:
+            with self.subTest(**overrides), self.assertRaises(ContentValidationError):
+                self._full_clean(Page(**{**valid_kwargs, **overrides}))
+    
+    def test_tag_validation(self):
+        """Test tag name normalization and rejection of blank names."""
+        tag = Tag(name='  ADVENTURE  ', world=self.world)
+        self._full_clean(tag)
         self.assertEqual(tag.name, 'adventure')
         
-        # Invalid tag - empty name
-        with self.assertRaises(ValidationError):
-            tag = Tag(
-                name='',
-                world=self.world
-            )
-            tag.full_clean()
+        for name in ['', '   ']:
+            with self.subTest(name=name), self.assertRaises(ValidationError):
+                self._full_clean(Tag(name=name, world=self.world))
+    
+    def test_serializer_validation_errors(self):
+        """Test serializer validation error handling."""
+        # Test page with invalid data
+        invalid_data = {
+            'title': '',  # Empty title
+            'content': 'Valid content that meets minimum requirements.'
+        }
+        serializer = PageSerializer(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('title', serializer.errors)
+        
+        # Test page with short content
+        invalid_data = {
+            'title': 'Valid Title',
+            'content': 'Short'  # Too short
+        }
+        serializer = PageSerializer(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('content', serializer.errors)
 
 
-class ImmutabilityEnforcementTest(TestCase):
+class ImmutabilityEnforcementTest(BaseWorldFixture):
     """Test immutability enforcement across content types."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_page_immutability(self):
         """Test that pages are immutable after creation."""
         page = Page.objects.create(
             title='Test Page',
-            content='This is test content that meets minimum length requirements.',
+            content=PAGE_CONTENT,
             author=self.user,
             world=self.world,
             summary='Test summary'
@@ -213,7 +196,7 @@ class ImmutabilityEnforcementTest(TestCase):
         """Test that essays are immutable after creation."""
         essay = Essay.objects.create(
             title='Test Essay',
-            content='This is test essay content that meets minimum length requirements for essays.',
+            content=ESSAY_CONTENT,
             author=self.user,
             world=self.world,
             abstract='Test abstract'
@@ -232,7 +215,7 @@ class ImmutabilityEnforcementTest(TestCase):
         """Test that force_update bypasses immutability."""
         page = Page.objects.create(
             title='Test Page',
-            content='This is test content that meets minimum length requirements.',
+            content=PAGE_CONTENT,
             author=self.user,
             world=self.world
         )
@@ -241,26 +224,18 @@ class ImmutabilityEnforcementTest(TestCase):
         page.title = 'Force Updated Title'
         page.save(force_update=True)
         
-        page.refresh_from_db()
+        page.refresh_from_db(fields=['title'])
         self.assertEqual(page.title, 'Force Updated Title')
 
 
-class APIImmutabilityTest(TestCase):
+class APIImmutabilityTest(BaseWorldFixture):
     """Test immutability enforcement at API level."""
     
+    client_class = APIClient
+    
     def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+        """Authenticate the API client."""
+        super().setUp()
         self.client.force_authenticate(user=self.user)
     
     def test_page_api_immutability(self):
@@ -268,7 +243,7 @@ class APIImmutabilityTest(TestCase):
         # Create page
         data = {
             'title': 'Test Page',
-            'content': 'This is test content that meets minimum length requirements.',
+            'content': PAGE_CONTENT,
             'summary': 'Test summary'
         }
         response = self.client.post(f'/api/worlds/{self.world.id}/pages/', data)
@@ -290,44 +265,30 @@ class APIImmutabilityTest(TestCase):
     
     def test_essay_api_immutability(self):
         """Test essay immutability through API."""
-        # Create essay
-        data = {
-            'title': 'Test Essay',
-            'content': 'This is test essay content that meets minimum length requirements for essays.',
-            'abstract': 'Test abstract'
-        }
-        response = self.client.post(f'/api/worlds/{self.world.id}/essays/', data)
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        essay_id = response.data['id']
+        # Create essay directly; the create endpoint is covered by the page test
+        essay = Essay.objects.create(
+            title='Test Essay',
+            content=ESSAY_CONTENT,
+            author=self.user,
+            world=self.world,
+            abstract='Test abstract'
+        )
         
         # Try to update (should be blocked)
         update_data = {'abstract': 'Modified abstract'}
-        response = self.client.put(f'/api/worlds/{self.world.id}/essays/{essay_id}/', update_data)
+        response = self.client.put(f'/api/worlds/{self.world.id}/essays/{essay.id}/', update_data)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
-class SerializerValidationTest(TestCase):
+class SerializerValidationTest(BaseWorldFixture):
     """Test serializer validation and data transformation."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            first_name='Test',
-            last_name='User'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-    
     def test_world_serializer(self):
         """Test WorldSerializer functionality."""
-        serializer = WorldSerializer(self.world)
-        data = serializer.data
+        # Fetch the world the way the views do before serializing it
+        world = WorldSerializer.setup_eager_loading(World.objects.all()).get(pk=self.world.pk)
+        with self.assertNumQueries(3):
+            data = WorldSerializer(world).data
         
         # Check required fields
         self.assertEqual(data['title'], 'Test World')
@@ -340,14 +301,14 @@ class SerializerValidationTest(TestCase):
         """Test PageSerializer functionality."""
         page = Page.objects.create(
             title='Test Page',
-            content='This is test content that meets minimum length requirements.',
+            content=PAGE_CONTENT,
             author=self.user,
             world=self.world,
             summary='Test summary'
         )
         
-        serializer = PageSerializer(page)
-        data = serializer.data
+        with self.assertNumQueries(3):
+            data = PageSerializer(page).data
         
         # Check required fields
         self.assertEqual(data['title'], 'Test Page')
@@ -361,65 +322,38 @@ class SerializerValidationTest(TestCase):
         """Test EssaySerializer functionality."""
         essay = Essay.objects.create(
             title='Test Essay',
-            content='This is test essay content that meets minimum length requirements for essays.',
+            content=ESSAY_CONTENT,
             author=self.user,
             world=self.world,
             abstract='Test abstract'
         )
         
-        serializer = EssaySerializer(essay)
-        data = serializer.data
+        with self.assertNumQueries(3):
+            data = EssaySerializer(essay).data
         
         # Check required fields
         self.assertEqual(data['title'], 'Test Essay')
         self.assertEqual(data['abstract'], 'Test abstract')
         self.assertGreater(data['word_count'], 0)
         self.assertIn('attribution', data)
-    
-    def test_serializer_validation_errors(self):
-        """Test serializer validation error handling."""
-        # Test page with invalid data
-        invalid_data = {
-            'title': '',  # Empty title
-            'content': 'Valid content that meets minimum requirements.'
-        }
-        serializer = PageSerializer(data=invalid_data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('title', serializer.errors)
-        
-        # Test page with short content
-        invalid_data = {
-            'title': 'Valid Title',
-            'content': 'Short'  # Too short
-        }
-        serializer = PageSerializer(data=invalid_data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('content', serializer.errors)
 
 
-class AuthenticationPermissionTest(TestCase):
-    """Test authentication and permission functionality."""
+class AuthenticationPermissionTest(BaseWorldFixture):
+    """
+    Test authentication and permission functionality.
+    Each permission case makes one routed client request; the remaining
+    checks call the viewsets directly.
+    """
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.creator = User.objects.create_user(
-            username='creator',
-            email='creator@example.com',
-            password='testpass123'
-        )
-        self.other_user = User.objects.create_user(
-            username='other',
-            email='other@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.creator
-        )
+    client_class = APIClient
+    
+    USERNAMES = ('creator', 'other')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Name the world creator and the other user."""
+        super().setUpTestData()
+        cls.creator, cls.other_user = cls.users
     
     def test_unauthenticated_access_denied(self):
         """Test that unauthenticated users cannot access protected endpoints."""
@@ -430,9 +364,9 @@ class AuthenticationPermissionTest(TestCase):
         # Content creation should require authentication
         data = {
             'title': 'Test Page',
-            'content': 'This is test content that meets minimum requirements.'
+            'content': PAGE_CONTENT
         }
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', data)
+        response = dispatch_to_viewset(PageViewSet, 'post', 'create', data, world_pk=self.world.id)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
     def test_authenticated_access_allowed(self):
@@ -446,18 +380,21 @@ class AuthenticationPermissionTest(TestCase):
         # Should be able to create content
         data = {
             'title': 'Test Page',
-            'content': 'This is test content that meets minimum requirements.',
+            'content': PAGE_CONTENT,
             'summary': 'Test summary'
         }
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', data)
+        response = dispatch_to_viewset(
+            PageViewSet, 'post', 'create', data, user=self.other_user, world_pk=self.world.id
+        )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
     
     def test_world_creator_permissions(self):
         """Test world creator permissions."""
         # Creator should be able to update world
-        self.client.force_authenticate(user=self.creator)
         data = {'title': 'Updated World Title'}
-        response = self.client.patch(f'/api/worlds/{self.world.id}/', data)
+        response = dispatch_to_viewset(
+            WorldViewSet, 'patch', 'partial_update', data, user=self.creator, pk=self.world.id
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Non-creator should not be able to update world
@@ -472,7 +409,7 @@ class AuthenticationPermissionTest(TestCase):
         
         data = {
             'title': 'Test Page',
-            'content': 'This is test content that meets minimum requirements.',
+            'content': PAGE_CONTENT,
             'summary': 'Test summary'
         }
         
@@ -483,33 +420,28 @@ class AuthenticationPermissionTest(TestCase):
         self.assertEqual(response.data['author']['username'], 'other')
 
 
-class TaggingLinkingTest(TestCase):
+class TaggingLinkingTest(BaseWorldFixture):
     """Test tagging and linking functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        self.page1 = Page.objects.create(
-            title='Test Page 1',
-            content='This is test content for page 1 that meets minimum requirements.',
-            author=self.user,
-            world=self.world
-        )
-        self.page2 = Page.objects.create(
-            title='Test Page 2',
-            content='This is test content for page 2 that meets minimum requirements.',
-            author=self.user,
-            world=self.world
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up two pages in the shared world."""
+        super().setUpTestData()
+        # Only tags and links are under test, so skip Page.save() bookkeeping
+        cls.page1, cls.page2 = Page.objects.bulk_create([
+            Page(
+                title='Test Page 1',
+                content='This is test content for page 1 that meets minimum requirements.',
+                author=cls.user,
+                world=cls.world
+            ),
+            Page(
+                title='Test Page 2',
+                content='This is test content for page 2 that meets minimum requirements.',
+                author=cls.user,
+                world=cls.world
+            ),
+        ])
     
     def test_tag_management(self):
         """Test tag management functionality."""
@@ -573,49 +505,39 @@ class TaggingLinkingTest(TestCase):
             self.page1.link_to(other_page)
 
 
-class ContributionTrackingTest(TestCase):
+class ContributionTrackingTest(BaseWorldFixture):
     """Test contribution tracking and statistics."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@example.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@example.com',
-            password='testpass123'
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user1
-        )
+    USERNAMES = ('user1', 'user2')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Name the two contributors and load the creator's profile."""
+        super().setUpTestData()
+        cls.user1, cls.user2 = cls.users
+        # Creating the shared world gave user1 a profile
+        cls.profile1 = UserProfile.objects.get(user=cls.user1)
     
     def test_contribution_count_tracking(self):
         """Test that contribution counts are tracked correctly."""
-        # Get initial profile
-        profile1, created = UserProfile.objects.get_or_create(user=self.user1)
+        profile1 = self.profile1
         initial_count = profile1.contribution_count
         
         # Create content
         Page.objects.create(
             title='Test Page',
-            content='This is test content that meets minimum requirements.',
+            content=PAGE_CONTENT,
             author=self.user1,
             world=self.world
         )
         
         # Check contribution count was updated
-        profile1.refresh_from_db()
+        profile1.refresh_from_db(fields=['contribution_count'])
         self.assertEqual(profile1.contribution_count, initial_count + 1)
     
     def test_world_creation_tracking(self):
         """Test that world creation is tracked in user profiles."""
-        # Get initial profile
-        profile1, created = UserProfile.objects.get_or_create(user=self.user1)
+        profile1 = self.profile1
         initial_count = profile1.worlds_created
         
         # Create another world
@@ -626,31 +548,36 @@ class ContributionTrackingTest(TestCase):
         )
         
         # Check world count was updated
-        profile1.refresh_from_db()
+        profile1.refresh_from_db(fields=['worlds_created'])
         self.assertEqual(profile1.worlds_created, initial_count + 1)
     
     def test_collaboration_statistics(self):
         """Test collaboration statistics calculation."""
-        # Create content by different users
-        page1 = Page.objects.create(
-            title='Page by User 1',
-            content='This is content by user 1 that meets minimum requirements.',
-            author=self.user1,
-            world=self.world
-        )
-        page2 = Page.objects.create(
-            title='Page by User 2',
-            content='This is content by user 2 that meets minimum requirements.',
-            author=self.user2,
-            world=self.world
-        )
+        # Create content by different users; the stats don't read profile counters
+        page1, page2 = Page.objects.bulk_create([
+            Page(
+                title='Page by User 1',
+                content='This is content by user 1 that meets minimum requirements.',
+                author=self.user1,
+                world=self.world
+            ),
+            Page(
+                title='Page by User 2',
+                content='This is content by user 2 that meets minimum requirements.',
+                author=self.user2,
+                world=self.world
+            ),
+        ])
         
         # Create cross-author link
         page1.link_to(page2)
         
         # Test world serializer includes collaboration stats
-        serializer = WorldSerializer(self.world)
-        data = serializer.data
+        # Counts, creator and tags come with the world; collaboration_stats
+        # still resolves both ends of every link on its own
+        world = WorldSerializer.setup_eager_loading(World.objects.all()).get(pk=self.world.pk)
+        with self.assertNumQueries(15):
+            data = WorldSerializer(world).data
         
         self.assertIn('collaboration_stats', data)
         self.assertIn('top_contributors', data)
@@ -660,51 +587,52 @@ class ContributionTrackingTest(TestCase):
         self.assertGreater(collab_stats['cross_author_collaborations'], 0)
 
 
-class BusinessLogicTest(TestCase):
+class BusinessLogicTest(BaseWorldFixture):
     """Test business logic and workflows."""
     
+    client_class = APIClient
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Give the shared user a full name for attribution."""
+        super().setUpTestData()
+        cls.user.first_name = 'Test'
+        cls.user.last_name = 'User'
+        cls.user.save(update_fields=['first_name', 'last_name'])
+    
     def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            first_name='Test',
-            last_name='User',
-        )
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+        """Authenticate the API client."""
+        super().setUp()
         self.client.force_authenticate(user=self.user)
-
+        # Warm the ContentType cache so query counts only cover the endpoint
+        ContentType.objects.get_for_model(Page)
+    
     def test_content_creation_workflow(self):
         """Test complete content creation workflow."""
         # Create page with tags
         data = {
             'title': 'Test Page',
-            'content': 'This is test content that meets minimum requirements.',
+            'content': PAGE_CONTENT,
             'summary': 'Test summary',
             'tags': ['fantasy', 'adventure']
         }
         
-        response = self.client.post(f'/api/worlds/{self.world.id}/pages/', data, format='json')
+        # Both tags are inserted in bulk, so more tags add no queries
+        with self.assertNumQueries(16):
+            response = self.client.post(f'/api/worlds/{self.world.id}/pages/', data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created = response.data
         
         # Check that author and world are set
-        self.assertEqual(response.data['author']['username'], 'testuser')
-        self.assertEqual(response.data['world'], self.world.id)
+        self.assertEqual(created['author']['username'], 'testuser')
+        self.assertEqual(created['world'], self.world.id)
         
         # Check that attribution is included
-        self.assertIn('attribution', response.data)
-        self.assertIn('Test User', response.data['attribution'])
+        self.assertIn('attribution', created)
+        self.assertIn('Test User', created['attribution'])
     
     def test_chronological_ordering(self):
         """Test that content is ordered chronologically."""
-        import time
-        
         # Create first page
         page1 = Page.objects.create(
             title='First Page',
@@ -713,9 +641,6 @@ class BusinessLogicTest(TestCase):
             world=self.world
         )
         
-        # Small delay
-        time.sleep(0.01)
-        
         # Create second page
         page2 = Page.objects.create(
             title='Second Page',
@@ -724,8 +649,13 @@ class BusinessLogicTest(TestCase):
             world=self.world
         )
         
-        # Get pages (should be ordered newest first)
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/')
+        # Backdate the first page instead of sleeping between the creates
+        Page.objects.filter(pk=page1.pk).update(created_at=page2.created_at - timedelta(seconds=1))
+        
+        # Get pages (should be ordered newest first); the query count
+        # stays constant however many pages are listed
+        with self.assertNumQueries(6):
+            response = self.client.get(f'/api/worlds/{self.world.id}/pages/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         pages = response.data
@@ -733,7 +663,8 @@ class BusinessLogicTest(TestCase):
             pages = pages['results']
         
         # Should be ordered by creation date (newest first)
-        self.assertTrue(pages[0]['created_at'] >= pages[1]['created_at'])
+        self.assertEqual([page['id'] for page in pages[:2]], [page2.id, page1.id])
+        self.assertGreater(pages[0]['created_at'], pages[1]['created_at'])
     
     def test_world_content_isolation(self):
         """Test that content is isolated between worlds."""
@@ -744,24 +675,25 @@ class BusinessLogicTest(TestCase):
             creator=self.user
         )
         
-        # Create content in first world
-        Page.objects.create(
-            title='Page in World 1',
-            content='This content is in world 1 and meets minimum requirements.',
-            author=self.user,
-            world=self.world
-        )
-        
-        # Create content in second world
-        Page.objects.create(
-            title='Page in World 2',
-            content='This content is in world 2 and meets minimum requirements.',
-            author=self.user,
-            world=other_world
-        )
+        # Create content in each world
+        Page.objects.bulk_create([
+            Page(
+                title='Page in World 1',
+                content='This content is in world 1 and meets minimum requirements.',
+                author=self.user,
+                world=self.world
+            ),
+            Page(
+                title='Page in World 2',
+                content='This content is in world 2 and meets minimum requirements.',
+                author=self.user,
+                world=other_world
+            ),
+        ])
         
         # List pages in first world
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/')
+        with self.assertNumQueries(6):
+            response = self.client.get(f'/api/worlds/{self.world.id}/pages/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         pages = response.data
@@ -776,22 +708,23 @@ class BusinessLogicTest(TestCase):
         """Test that attribution is properly displayed."""
         page = Page.objects.create(
             title='Test Page',
-            content='This is test content that meets minimum requirements.',
+            content=PAGE_CONTENT,
             author=self.user,
             world=self.world
         )
         
-        response = self.client.get(f'/api/worlds/{self.world.id}/pages/{page.id}/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Attribution comes from the serializer; no request round trip needed
+        with self.assertNumQueries(3):
+            data = PageSerializer(page).data
         
         # Check attribution
-        self.assertIn('attribution', response.data)
-        attribution = response.data['attribution']
+        self.assertIn('attribution', data)
+        attribution = data['attribution']
         self.assertIn('Created by', attribution)
         self.assertIn('Test User', attribution)
         
         # Check collaboration info
-        self.assertIn('collaboration_info', response.data)
-        collab_info = response.data['collaboration_info']
+        self.assertIn('collaboration_info', data)
+        collab_info = data['collaboration_info']
         self.assertIn('is_collaborative', collab_info)
         self.assertIn('collaboration_score', collab_info)
\ No newline at end of file
@@ -2,39 +2,25 @@
 Unit tests for ViewSets in the collaborative worldbuilding application.
 Tests API functionality, permissions, and business logic.
 """
-from django.test import TestCase
-from django.contrib.auth.models import User
 from rest_framework.test import APIClient
 from rest_framework import status
 from .models import World, Page, Essay, Character, Story, Image, Tag
 from .permissions import IsCreatorOrReadOnly, IsAuthorOrReadOnly
+from .factories import BaseWorldFixture
 
 
-class WorldViewSetTest(TestCase):
+class WorldViewSetTest(BaseWorldFixture):
     """Test WorldViewSet functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        # Create test users
-        self.user1 = User.objects.create_user(
-            username='creator',
-            email='creator@example.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='other',
-            email='other@example.com',
-            password='testpass123'
-        )
-        
-        # Create test world
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user1
-        )
+    client_class = APIClient
+    
+    USERNAMES = ('creator', 'other')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Name the world creator and the second user."""
+        super().setUpTestData()
+        cls.user1, cls.user2 = cls.users
     
     def test_world_list_authenticated(self):
         """Test listing worlds requires authentication."""
@@ -164,31 +150,18 @@ class WorldViewSetTest(TestCase):
         self.assertIn('recent_activity', response.data)
 
 
-class ContentViewSetTest(TestCase):
+class ContentViewSetTest(BaseWorldFixture):
     """Test content ViewSet functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        # Create test users
-        self.user1 = User.objects.create_user(
-            username='author1',
-            email='author1@example.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='author2',
-            email='author2@example.com',
-            password='testpass123'
-        )
-        
-        # Create test world
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user1
-        )
+    client_class = APIClient
+    
+    USERNAMES = ('author1', 'author2')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Name the world creator and the second user."""
+        super().setUpTestData()
+        cls.user1, cls.user2 = cls.users
     
     def test_page_creation(self):
         """Test page creation functionality."""
@@ -380,24 +353,10 @@ class ContentViewSetTest(TestCase):
         self.assertIn('attribution_suggestions', response.data)
 
 
-class EssayViewSetTest(TestCase):
+class EssayViewSetTest(BaseWorldFixture):
     """Test EssayViewSet specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    client_class = APIClient
     
     def test_essay_creation(self):
         """Test essay creation functionality."""
@@ -439,24 +398,10 @@ class EssayViewSetTest(TestCase):
         self.assertEqual(len(response.data['results']), 1)  # Only long essay should match
 
 
-class CharacterViewSetTest(TestCase):
+class CharacterViewSetTest(BaseWorldFixture):
     """Test CharacterViewSet specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    client_class = APIClient
     
     def test_character_creation(self):
         """Test character creation functionality."""
@@ -519,24 +464,10 @@ class CharacterViewSetTest(TestCase):
         self.assertEqual(results[0]['occupation'], 'Mage')
 
 
-class StoryViewSetTest(TestCase):
+class StoryViewSetTest(BaseWorldFixture):
     """Test StoryViewSet specific functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    client_class = APIClient
     
     def test_story_creation(self):
         """Test story creation functionality."""
@@ -598,43 +529,23 @@ class StoryViewSetTest(TestCase):
         self.assertTrue(results[0]['is_canonical'])
 
 
-class PermissionTest(TestCase):
+class PermissionTest(BaseWorldFixture):
     """Test permission classes functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        # Create test users
-        self.creator = User.objects.create_user(
-            username='creator',
-            email='creator@example.com',
-            password='testpass123'
-        )
-        self.author = User.objects.create_user(
-            username='author',
-            email='author@example.com',
-            password='testpass123'
-        )
-        self.other = User.objects.create_user(
-            username='other',
-            email='other@example.com',
-            password='testpass123'
-        )
-        
-        # Create test world
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.creator
-        )
-        
-        # Create test content
-        self.page = Page.objects.create(
+    client_class = APIClient
+    
+    USERNAMES = ('creator', 'author', 'other')
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a page in the creator's world written by another user."""
+        super().setUpTestData()
+        cls.creator, cls.author, cls.other = cls.users
+        cls.page = Page.objects.create(
             title='Test Page',
             content='Test content',
-            author=self.author,
-            world=self.world
+            author=cls.author,
+            world=cls.world
         )
     
     def test_unauthenticated_access(self):
@@ -697,33 +608,25 @@ class PermissionTest(TestCase):
         self.assertEqual(response.data['author']['username'], 'other')
 
 
-class PaginationTest(TestCase):
+class PaginationTest(BaseWorldFixture):
     """Test pagination functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
-        
-        # Create multiple pages for pagination testing
-        for i in range(25):
-            Page.objects.create(
+    client_class = APIClient
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up more pages than fit on one page of results."""
+        super().setUpTestData()
+        # Only the listing is under test, so skip Page.save() bookkeeping
+        Page.objects.bulk_create([
+            Page(
                 title=f'Page {i}',
                 content=f'Content for page {i}',
-                author=self.user,
-                world=self.world
+                author=cls.user,
+                world=cls.world
             )
+            for i in range(25)
+        ])
     
     def test_page_list_pagination(self):
         """Test that page lists are properly paginated."""
@@ -744,24 +647,10 @@ class PaginationTest(TestCase):
             self.assertIsInstance(response.data, list)
 
 
-class ErrorHandlingTest(TestCase):
+class ErrorHandlingTest(BaseWorldFixture):
     """Test error handling in ViewSets."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        
-        self.world = World.objects.create(
-            title='Test World',
-            description='A test world',
-            creator=self.user
-        )
+    client_class = APIClient
     
     def test_invalid_world_id(self):
         """Test handling of invalid world IDs."""
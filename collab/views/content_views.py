@@ -23,6 +23,8 @@ class ContentViewSetMixin:
     Handles world-scoped content, immutability enforcement, and tagging.
     """
     permission_classes = [permissions.IsAuthenticated, IsAuthorOrReadOnly]
+    # Actions that serialize content from get_queryset() with the serializer
+    eager_loading_actions = ('list', 'retrieve', 'chronological', 'chronological_content')
     
     def get_world(self):
         """Get the world from URL parameters."""
@@ -33,9 +35,16 @@ class ContentViewSetMixin:
         return get_object_or_404(World, pk=world_id)
     
     def get_queryset(self):
-        """Filter content by world and optimize queries."""
+        """
+        Filter content by world and optimize queries.
+        Serializing actions also prefetch tags and links; the other actions
+        only read the entry itself, so they skip those prefetches.
+        """
         world = self.get_world()
-        return self.queryset.filter(world=world).select_related(
+        queryset = self.queryset.filter(world=world)
+        if self.action in self.eager_loading_actions:
+            return self.serializer_class.setup_eager_loading(queryset)
+        return queryset.select_related(
             'author', 'world'
         ).prefetch_related(
             'author__worldbuilding_profile'
@@ -80,17 +89,11 @@ class ContentViewSetMixin:
                 # Other validation errors
                 raise ContentValidationError(str(e))
         
-        # Handle tags if provided
+        # Handle tags if provided; add_tags() accepts a list or a
+        # comma-separated string and inserts the tags in bulk
         tags_data = request.data.get('tags', [])
         if tags_data:
-            if isinstance(tags_data, str):
-                tag_names = [name.strip() for name in tags_data.split(',')]
-            else:
-                tag_names = tags_data
-            
-            for tag_name in tag_names:
-                if tag_name.strip():
-                    content.add_tag(tag_name.strip())
+            content.add_tags(tags_data)
         
         # Handle content links if provided
         links_data = request.data.get('links', [])
@@ -121,12 +124,9 @@ class ContentViewSetMixin:
                     continue
         
         # Return the created content with full serialization
-        headers = self.get_success_headers(serializer.data)
-        return Response(
-            self.get_serializer(content).data,
-            status=status.HTTP_201_CREATED,
-            headers=headers
-        )
+        data = self.get_serializer(content).data
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
     
     def update(self, request, *args, **kwargs):
         """
@@ -326,6 +326,8 @@ class ContentViewSetMixin:
                 Q(title__icontains=search) | Q(content__icontains=search)
             )
         
+        queryset = self.serializer_class.setup_eager_loading(queryset)
+        
         # Paginate results
         page = self.paginate_queryset(queryset)
         if page is not None:
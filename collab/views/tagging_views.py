@@ -156,7 +156,7 @@ class TagViewSet(viewsets.ModelViewSet):
         }
         
         for type_name, model_class in content_models.items():
-            content_queryset = model_class.get_content_by_tag(world, tag.name)
+            content_queryset = model_class.get_content_by_tag(world, tag.name).select_related('author')
             
             for content in content_queryset:
                 tagged_content.append({
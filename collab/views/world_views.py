@@ -4,13 +4,205 @@ Views for managing World resources.
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Q
+from django.db import connection
+from django.db.models import BooleanField, Count, Q
+from django.db.models.expressions import RawSQL
+from django.core.cache import cache
 from django.contrib.contenttypes.models import ContentType
-from ..models import World, ContentTag, Page, Essay, Character, Story, Image
+from ..models import World, ContentTag, ContentLink, Page, Essay, Character, Story, Image
 from ..serializers import WorldSerializer, WorldDetailSerializer
 from ..permissions import IsCreatorOrReadOnly
 
 
+# Seconds to keep per-world aggregate responses. World.save(), content
+# save/soft_delete()/restore(), link_to()/unlink_from(), content hard deletes
+# and user renames bump World.cache_version, which invalidates them sooner.
+# Writes that skip those paths (bulk_create(), queryset update() and
+# ContentTag changes) are only picked up once the timeout expires.
+WORLD_AGGREGATE_CACHE_TIMEOUT = 60
+
+
+def _world_cache_key(world, name):
+    """Cache key for a per-world aggregate, tied to the world's cache version."""
+    return f'world:{world.pk}:{name}:{world.cache_version.hex}'
+
+
+def _content_key(content):
+    """Key identifying a content entry across content types."""
+    return (ContentType.objects.get_for_model(content).id, content.id)
+
+
+def _tag_names_by_content(contents):
+    """
+    Map each content entry's key to its tag names.
+    Uses one query per content type instead of one per entry.
+    """
+    ids_by_type = {}
+    for content in contents:
+        content_type_id, content_id = _content_key(content)
+        ids_by_type.setdefault(content_type_id, []).append(content_id)
+    
+    tag_names = {}
+    for content_type_id, content_ids in ids_by_type.items():
+        content_tags = ContentTag.objects.filter(
+            content_type_id=content_type_id,
+            object_id__in=content_ids
+        ).select_related('tag').order_by('tag_id')
+        for content_tag in content_tags:
+            tag_names.setdefault(
+                (content_type_id, content_tag.object_id), []
+            ).append(content_tag.tag.name)
+    
+    return tag_names
+
+
+def _link_index(contents):
+    """
+    Index the links between the given content entries in a single query.
+    Returns (outgoing, incoming) dicts mapping a content key to the linked
+    content objects, mirroring get_linked_content() and
+    get_content_linking_to_this() without a query per entry.
+    """
+    content_by_key = {_content_key(content): content for content in contents}
+    
+    ids_by_type = {}
+    for content_type_id, content_id in content_by_key:
+        ids_by_type.setdefault(content_type_id, []).append(content_id)
+    
+    outgoing = {}
+    incoming = {}
+    if not ids_by_type:
+        return outgoing, incoming
+    
+    from_filter = Q()
+    for content_type_id, content_ids in ids_by_type.items():
+        from_filter |= Q(from_content_type_id=content_type_id, from_object_id__in=content_ids)
+    
+    for link in ContentLink.objects.filter(from_filter).order_by('id'):
+        from_key = (link.from_content_type_id, link.from_object_id)
+        to_key = (link.to_content_type_id, link.to_object_id)
+        if to_key not in content_by_key:
+            continue
+        outgoing.setdefault(from_key, []).append(content_by_key[to_key])
+        incoming.setdefault(to_key, []).append(content_by_key[from_key])
+    
+    return outgoing, incoming
+
+
+# Documents covered by the PostgreSQL GIN full-text indexes from migration
+# 0003; the search filter must use the same expressions to hit the indexes
+_FULLTEXT_DOCUMENTS = {
+    Page: "{t}.title || ' ' || {t}.content || ' ' || COALESCE({t}.summary, '')",
+    Essay: "{t}.title || ' ' || {t}.content || ' ' || COALESCE({t}.abstract, '')",
+    Character: (
+        "{t}.title || ' ' || {t}.content || ' ' || {t}.full_name || ' ' || "
+        "COALESCE({t}.species, '') || ' ' || COALESCE({t}.occupation, '') || ' ' || "
+        "COALESCE({t}.location, '') || ' ' || COALESCE({t}.physical_description, '') || ' ' || "
+        "COALESCE({t}.background, '')"
+    ),
+    Story: (
+        "{t}.title || ' ' || {t}.content || ' ' || COALESCE({t}.genre, '') || ' ' || "
+        "COALESCE({t}.timeline_period, '') || ' ' || COALESCE({t}.setting_location, '')"
+    ),
+    Image: "{t}.title || ' ' || {t}.content || ' ' || COALESCE({t}.caption, '') || ' ' || {t}.alt_text",
+}
+
+
+def _text_search_filter(model_class, query):
+    """
+    Filter matching a search query against a content model.
+    PostgreSQL uses the full-text GIN indexes; other backends fall back to
+    case-insensitive substring matching on title and content.
+    """
+    if connection.vendor != 'postgresql':
+        return Q(title__icontains=query) | Q(content__icontains=query)
+    
+    document = _FULLTEXT_DOCUMENTS[model_class].format(
+        t=connection.ops.quote_name(model_class._meta.db_table)
+    )
+    return RawSQL(
+        f"to_tsvector('english', {document}) @@ plainto_tsquery('english', %s)",
+        [query],
+        output_field=BooleanField()
+    )
+
+
+def _cross_author_link_count(contents, outgoing_links):
+    """
+    Count links between content by different authors, using the outgoing
+    link index from _link_index() instead of querying again.
+    """
+    return sum(
+        1
+        for content in contents
+        for linked in outgoing_links.get(_content_key(content), [])
+        if linked.author_id != content.author_id
+    )
+
+
+def _build_attribution_network(contents, outgoing_links, incoming_links):
+    """
+    Build the per-author attribution network from a world's content and its
+    link index. Pure over its inputs, so the attribution report that embeds
+    it is cached per world version.
+    Returns (attribution_network, cross_references).
+    """
+    attribution_network = {}
+    cross_references = []
+    
+    for content in contents:
+        author_username = content.author.username
+        
+        if author_username not in attribution_network:
+            attribution_network[author_username] = {
+                'authored_count': 0,
+                'references_to_others': 0,
+                'references_from_others': 0,
+                'collaborates_with': set(),
+                'content_types': set()
+            }
+        
+        attribution_network[author_username]['authored_count'] += 1
+        attribution_network[author_username]['content_types'].add(content.__class__.__name__.lower())
+        
+        # Check links to other authors' content
+        linked_content = outgoing_links.get(_content_key(content), [])
+        for linked in linked_content:
+            if linked.author.username != author_username:
+                attribution_network[author_username]['references_to_others'] += 1
+                attribution_network[author_username]['collaborates_with'].add(linked.author.username)
+                
+                cross_references.append({
+                    'from_author': author_username,
+                    'to_author': linked.author.username,
+                    'from_content': {
+                        'id': content.id,
+                        'title': content.title,
+                        'type': content.__class__.__name__.lower()
+                    },
+                    'to_content': {
+                        'id': linked.id,
+                        'title': linked.title,
+                        'type': linked.__class__.__name__.lower()
+                    },
+                    'created_at': content.created_at
+                })
+        
+        # Check links from other authors' content
+        linking_content = incoming_links.get(_content_key(content), [])
+        for linking in linking_content:
+            if linking.author.username != author_username:
+                attribution_network[author_username]['references_from_others'] += 1
+                attribution_network[author_username]['collaborates_with'].add(linking.author.username)
+    
+    # Convert sets to lists for JSON serialization
+    for author_data in attribution_network.values():
+        author_data['collaborates_with'] = list(author_data['collaborates_with'])
+        author_data['content_types'] = list(author_data['content_types'])
+    
+    return attribution_network, cross_references
+
+
 class WorldViewSet(viewsets.ModelViewSet):
     """
     API endpoint that allows worlds to be viewed or edited.
@@ -25,30 +217,24 @@ class WorldViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         Get worlds with optimized queries for contributor counts.
+        Custom actions (timeline, search, ...) query content themselves and
+        only need the world row, so they skip the prefetches and annotations.
         """
-        return World.objects.select_related(
-            'creator__worldbuilding_profile'
-        ).prefetch_related(
-            'page_entries__author',
-            'essay_entries__author', 
-            'character_entries__author',
-            'story_entries__author',
-            'image_entries__author',
-            'tags'
-        ).annotate(
-            # Count unique contributors across all content types
-            contributor_count=Count(
-                'page_entries__author', distinct=True
-            ) + Count(
-                'essay_entries__author', distinct=True
-            ) + Count(
-                'character_entries__author', distinct=True
-            ) + Count(
-                'story_entries__author', distinct=True
-            ) + Count(
-                'image_entries__author', distinct=True
+        if self.action not in ('list', 'retrieve', 'update', 'partial_update'):
+            return World.objects.select_related('creator').order_by('-created_at')
+
+        # Creator, tags, content and contributor counts in a fixed number of queries
+        queryset = WorldSerializer.setup_eager_loading(World.objects.all())
+        if self.action == 'retrieve':
+            # Recent content listings of the detail serializer read these
+            queryset = queryset.prefetch_related(
+                'page_entries__author',
+                'essay_entries__author', 
+                'character_entries__author',
+                'story_entries__author',
+                'image_entries__author',
             )
-        ).order_by('-created_at')
+        return queryset.order_by('-created_at')
 
     def get_serializer_class(self):
         """
@@ -111,7 +297,15 @@ class WorldViewSet(viewsets.ModelViewSet):
         Enhanced with attribution and collaboration tracking.
         """
         world = self.get_object()
-        
+        cache_key = _world_cache_key(world, 'contributors')
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._build_contributors(world)
+            cache.set(cache_key, data, WORLD_AGGREGATE_CACHE_TIMEOUT)
+        return Response(data)
+    
+    def _build_contributors(self, world):
+        """Compute the contributors payload for a world."""
         # Get all unique contributors across content types
         from django.contrib.auth.models import User
         from django.db.models import Count, Q
@@ -137,20 +331,18 @@ class WorldViewSet(viewsets.ModelViewSet):
                               Count('image_authored', filter=Q(image_authored__world=world))
         ).order_by('-total_contributions')
 
+        # Load the world's content and links once and group them per author,
+        # rather than querying each contributor's content and links separately
+        world_content = world.get_content_timeline()
+        outgoing_links, incoming_links = _link_index(world_content)
+        content_by_author = {}
+        for content in world_content:
+            content_by_author.setdefault(content.author_id, []).append(content)
+        
         contributor_data = []
         for contributor in contributors:
             # Get collaboration metrics for this contributor
-            all_content = []
-            if contributor.page_authored.filter(world=world).exists():
-                all_content.extend(contributor.page_authored.filter(world=world))
-            if contributor.essay_authored.filter(world=world).exists():
-                all_content.extend(contributor.essay_authored.filter(world=world))
-            if contributor.character_authored.filter(world=world).exists():
-                all_content.extend(contributor.character_authored.filter(world=world))
-            if contributor.story_authored.filter(world=world).exists():
-                all_content.extend(contributor.story_authored.filter(world=world))
-            if contributor.image_authored.filter(world=world).exists():
-                all_content.extend(contributor.image_authored.filter(world=world))
+            all_content = list(content_by_author.get(contributor.id, []))
             
             # Calculate collaboration metrics
             total_links_created = 0
@@ -158,18 +350,20 @@ class WorldViewSet(viewsets.ModelViewSet):
             collaborating_authors = set()
             
             for content in all_content:
+                content_key = _content_key(content)
+                
                 # Links this contributor created to others
-                linked_content = content.get_linked_content()
+                linked_content = outgoing_links.get(content_key, [])
                 total_links_created += len(linked_content)
                 for linked in linked_content:
-                    if linked.author != contributor:
+                    if linked.author_id != contributor.id:
                         collaborating_authors.add(linked.author.username)
                 
                 # Links others created to this contributor's content
-                linking_content = content.get_content_linking_to_this()
+                linking_content = incoming_links.get(content_key, [])
                 total_links_received += len(linking_content)
                 for linking in linking_content:
-                    if linking.author != contributor:
+                    if linking.author_id != contributor.id:
                         collaborating_authors.add(linking.author.username)
             
             # Get contribution timeline
@@ -218,7 +412,7 @@ class WorldViewSet(viewsets.ModelViewSet):
                 'attribution': f"{contributor.get_full_name() or contributor.username} - {contributor.total_contributions} contributions"
             })
 
-        return Response({
+        return {
             'world': {
                 'id': world.id,
                 'title': world.title,
@@ -227,12 +421,12 @@ class WorldViewSet(viewsets.ModelViewSet):
             'total_contributors': len(contributor_data),
             'contributors': contributor_data,
             'collaboration_summary': {
-                'total_cross_author_links': sum(c['collaboration_metrics']['links_created'] + c['collaboration_metrics']['links_received'] for c in contributor_data) // 2,
+                'total_cross_author_links': _cross_author_link_count(world_content, outgoing_links),
                 'most_collaborative': max(contributor_data, key=lambda x: x['collaboration_metrics']['collaboration_count'])['username'] if contributor_data else None,
                 'most_active': max(contributor_data, key=lambda x: x['contributions']['total'])['username'] if contributor_data else None,
                 'recent_contributors': len([c for c in contributor_data if c['activity_timeline']['recent_activity_count'] > 0])
             }
-        })
+        }
 
     @action(detail=True, methods=['get'])
     def timeline(self, request, pk=None):
@@ -358,6 +552,9 @@ class WorldViewSet(viewsets.ModelViewSet):
         total_count = len(all_content)
         paginated_content = all_content[offset:offset + limit]
         
+        # Fetch tags for the returned page in one query per content type
+        tags_by_content = _tag_names_by_content(paginated_content)
+        
         # Convert to serializable format
         timeline_data = []
         for content in paginated_content:
@@ -375,7 +572,7 @@ class WorldViewSet(viewsets.ModelViewSet):
                 'created_at': content.created_at,
                 'timeline_position': content.created_at.isoformat(),
                 'summary': getattr(content, 'summary', '')[:200] if hasattr(content, 'summary') else content.content[:200],
-                'tags': [tag.name for tag in content.get_tags()],
+                'tags': tags_by_content.get(_content_key(content), []),
                 'url': f'/api/worlds/{world.id}/{content.__class__.__name__.lower()}s/{content.id}/'
             })
 
@@ -519,9 +716,7 @@ class WorldViewSet(viewsets.ModelViewSet):
             queryset = model_class.objects.filter(world=world)
             
             # Text search
-            queryset = queryset.filter(
-                Q(title__icontains=query) | Q(content__icontains=query)
-            )
+            queryset = queryset.filter(_text_search_filter(model_class, query))
             
             # Apply filters
             if author_username:
@@ -574,6 +769,9 @@ class WorldViewSet(viewsets.ModelViewSet):
         # Limit results
         search_results = search_results[:limit]
         
+        # Fetch tags for the returned results in one query per content type
+        tags_by_content = _tag_names_by_content(result['content'] for result in search_results)
+        
         # Serialize results
         results = []
         for result in search_results:
@@ -591,7 +789,7 @@ class WorldViewSet(viewsets.ModelViewSet):
                 'created_at': content.created_at,
                 'relevance_score': result['relevance_score'],
                 'summary': getattr(content, 'summary', '')[:200] if hasattr(content, 'summary') else content.content[:200],
-                'tags': [tag.name for tag in content.get_tags()],
+                'tags': tags_by_content.get(_content_key(content), []),
                 'url': f'/api/worlds/{world.id}/{result["content_type"]}s/{content.id}/'
             })
         
@@ -797,63 +995,22 @@ class WorldViewSet(viewsets.ModelViewSet):
         This helps track collaborative patterns and proper attribution practices.
         """
         world = self.get_object()
-        
-        # Get all content in the world
+        cache_key = _world_cache_key(world, 'attribution_report')
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._build_attribution_report(world)
+            cache.set(cache_key, data, WORLD_AGGREGATE_CACHE_TIMEOUT)
+        return Response(data)
+    
+    def _build_attribution_report(self, world):
+        """Compute the attribution report payload for a world."""
+        # Get all content in the world and the links between it
         all_content = world.get_content_timeline()
+        outgoing_links, incoming_links = _link_index(all_content)
         
-        # Build attribution network
-        attribution_network = {}
-        cross_references = []
-        
-        for content in all_content:
-            author_username = content.author.username
-            
-            if author_username not in attribution_network:
-                attribution_network[author_username] = {
-                    'authored_count': 0,
-                    'references_to_others': 0,
-                    'references_from_others': 0,
-                    'collaborates_with': set(),
-                    'content_types': set()
-                }
-            
-            attribution_network[author_username]['authored_count'] += 1
-            attribution_network[author_username]['content_types'].add(content.__class__.__name__.lower())
-            
-            # Check links to other authors' content
-            linked_content = content.get_linked_content()
-            for linked in linked_content:
-                if linked.author.username != author_username:
-                    attribution_network[author_username]['references_to_others'] += 1
-                    attribution_network[author_username]['collaborates_with'].add(linked.author.username)
-                    
-                    cross_references.append({
-                        'from_author': author_username,
-                        'to_author': linked.author.username,
-                        'from_content': {
-                            'id': content.id,
-                            'title': content.title,
-                            'type': content.__class__.__name__.lower()
-                        },
-                        'to_content': {
-                            'id': linked.id,
-                            'title': linked.title,
-                            'type': linked.__class__.__name__.lower()
-                        },
-                        'created_at': content.created_at
-                    })
-            
-            # Check links from other authors' content
-            linking_content = content.get_content_linking_to_this()
-            for linking in linking_content:
-                if linking.author.username != author_username:
-                    attribution_network[author_username]['references_from_others'] += 1
-                    attribution_network[author_username]['collaborates_with'].add(linking.author.username)
-        
-        # Convert sets to lists for JSON serialization
-        for author_data in attribution_network.values():
-            author_data['collaborates_with'] = list(author_data['collaborates_with'])
-            author_data['content_types'] = list(author_data['content_types'])
+        attribution_network, cross_references = _build_attribution_network(
+            all_content, outgoing_links, incoming_links
+        )
         
         # Calculate collaboration metrics
         total_authors = len(attribution_network)
@@ -870,7 +1027,7 @@ class WorldViewSet(viewsets.ModelViewSet):
         
         top_collaborations = sorted(collaboration_pairs.items(), key=lambda x: x[1], reverse=True)[:5]
         
-        return Response({
+        return {
             'world': {
                 'id': world.id,
                 'title': world.title,
@@ -900,4 +1057,4 @@ class WorldViewSet(viewsets.ModelViewSet):
                                       'good' if collaborative_authors / max(total_authors, 1) > 0.4 else 
                                       'needs_improvement'
             }
-        })
\ No newline at end of file
+        }
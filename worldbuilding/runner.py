@@ -0,0 +1,110 @@
+"""
+Test runner for worldbuilding project that reports the slowest tests of a run
+and can profile the whole suite with cProfile.
+Tests tagged ``slow`` are skipped unless --include-slow or --tag slow is given.
+Enabled for ``manage.py test`` through TEST_RUNNER in the test settings.
+"""
+import cProfile
+import io
+import pstats
+import time
+import unittest
+
+from django.test.runner import DiscoverRunner
+
+
+class TimeLoggingTestResult(unittest.TextTestResult):
+    """Text test result that records the wall time of every test."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_timings = []
+
+    def startTest(self, test):
+        self._test_started_at = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.test_timings.append((test.id(), time.perf_counter() - self._test_started_at))
+
+
+class TimeLoggingTestRunner(DiscoverRunner):
+    """
+    Discover runner that lists the slowest tests after the run and flags any
+    test slower than the configured threshold. Excludes tests tagged ``slow``
+    by default.
+    """
+
+    def __init__(self, slowest=10, slow_test_threshold=0.5, profile=None, include_slow=False, **kwargs):
+        if not include_slow and 'slow' not in (kwargs.get('tags') or ()):
+            kwargs['exclude_tags'] = {*(kwargs.get('exclude_tags') or ()), 'slow'}
+        super().__init__(**kwargs)
+        self.slowest = slowest
+        self.slow_test_threshold = slow_test_threshold
+        self.profile = profile
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--slowest', type=int, default=10,
+            help='Number of slowest tests to report (0 disables the report).',
+        )
+        parser.add_argument(
+            '--slow-test-threshold', type=float, default=0.5,
+            help='Flag tests that take longer than this many seconds.',
+        )
+        parser.add_argument(
+            '--profile', nargs='?', const='', default=None, metavar='FILE',
+            help='Profile the test run with cProfile and list the most expensive '
+                 'functions; optionally write the raw stats to FILE.',
+        )
+        parser.add_argument(
+            '--include-slow', action='store_true',
+            help='Also run the end-to-end tests tagged "slow", which are skipped by default.',
+        )
+
+    def get_resultclass(self):
+        # --debug-sql and --pdb bring their own result classes
+        return super().get_resultclass() or TimeLoggingTestResult
+
+    def run_suite(self, suite, **kwargs):
+        if self.profile is None:
+            return super().run_suite(suite, **kwargs)
+        profiler = cProfile.Profile()
+        result = profiler.runcall(super().run_suite, suite, **kwargs)
+        self.log_profile(profiler)
+        return result
+
+    def suite_result(self, suite, result, **kwargs):
+        timings = getattr(result, 'test_timings', None)
+        # Under --parallel, results are replayed from the workers, so the
+        # recorded times would only measure the replay
+        if timings and self.slowest > 0 and self.parallel <= 1:
+            self.log_slowest_tests(timings)
+        return super().suite_result(suite, result, **kwargs)
+
+    def log_slowest_tests(self, timings):
+        """Log the slowest tests and how many exceeded the threshold."""
+        timings = sorted(timings, key=lambda timing: timing[1], reverse=True)
+        self.log(f'\nSlowest {min(self.slowest, len(timings))} tests:')
+        for test_id, duration in timings[:self.slowest]:
+            marker = ' (slow)' if duration > self.slow_test_threshold else ''
+            self.log(f'  {duration:.3f}s {test_id}{marker}')
+
+        slow_count = len([duration for _, duration in timings if duration > self.slow_test_threshold])
+        if slow_count:
+            self.log(f'{slow_count} test(s) took longer than {self.slow_test_threshold}s')
+
+    def log_profile(self, profiler):
+        """Log the functions with the highest cumulative time of the run."""
+        if self.profile:
+            profiler.dump_stats(self.profile)
+            self.log(f'\nProfile stats written to {self.profile}')
+        # Worker processes are not profiled, so only the serial run is meaningful
+        if self.parallel > 1:
+            self.log('Profiling only covers the main process under --parallel')
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(25)
+        self.log(stream.getvalue())
@@ -13,5 +13,7 @@ if env == 'production':
     from .production import *
 elif env == 'development':
     from .development import *
+elif env == 'test':
+    from .test import *
 else:
     from .base import *
@@ -18,6 +18,13 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # File-backed test database, so `manage.py test --keepdb` can reuse
+        # the migrated schema between runs instead of replaying migrations.
+        # It is a local build artifact (ignored by git); without --keepdb
+        # the test runner deletes it when the run finishes
+        'TEST': {
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        },
     }
 }
 
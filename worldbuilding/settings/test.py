@@ -0,0 +1,68 @@
+"""
+Test settings for worldbuilding project.
+Selected automatically by ``manage.py test`` (DJANGO_ENV=test).
+"""
+
+from datetime import timedelta
+
+from .development import *
+
+# In-memory SQLite, independent of the development database file. Each
+# --parallel worker gets its own in-memory clone.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': ':memory:',
+        },
+    }
+}
+
+# Fast password hashing for tests - PBKDF2 dominates create_user() and login
+# calls in the suite. Never use this hasher outside of tests.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Pin JWT signing to HS256 with a fixed key and short lifetimes so token
+# issue/refresh stays cheap and independent of the deployment's key setup
+SIMPLE_JWT = {
+    **SIMPLE_JWT,
+    'ALGORITHM': 'HS256',
+    'SIGNING_KEY': 'test-signing-key-not-for-production-use',
+    'VERIFYING_KEY': None,
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+}
+
+# Keep the suite self-contained: uploads stay in memory instead of landing in
+# MEDIA_ROOT (or a cloud bucket), and mail never leaves the process
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.InMemoryStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# Keep DEBUG off so connection.queries isn't accumulated across the suite
+DEBUG = False
+
+
+class DisableMigrations:
+    """Build the test database straight from the models instead of replaying migrations."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+# Report the slowest tests after each run (see worldbuilding/runner.py)
+TEST_RUNNER = 'worldbuilding.runner.TimeLoggingTestRunner'